@@ -1,22 +1,96 @@
 import serial
 import serial.tools.list_ports
+import queue
+import struct
 import threading
 import time
 import asyncio
 
+# One actuator command on the wire: three bytes (see create_command)
+_COMMAND = struct.Struct("3B")
+
+# Pending writes buffered for the writer thread before callers block
+_TX_QUEUE_SIZE = 256
+
 class python_serial_api:
     def __init__(self):  # Fixed: was _init_ instead of __init__
         self.MOTOR_UUID = 'f22535de-5375-44bd-8ca9-d0ea9ff9e410'  # Keep for compatibility
         self.serial_connection = None
         self.connected = False
+        self._tx_q = None
+        self._tx_thread = None
+        # First exception raised by the writer thread; send_* fail while it is set
+        self.last_error = None
+
+    # --- background writer -------------------------------------------------
+    def _start_writer(self):
+        """Serial writes go through a queue drained by one daemon thread."""
+        self._stop_writer()
+        self.last_error = None
+        self._tx_q = queue.Queue(maxsize=_TX_QUEUE_SIZE)
+        self._tx_thread = threading.Thread(
+            target=self._writer_loop, args=(self.serial_connection, self._tx_q), daemon=True
+        )
+        self._tx_thread.start()
+
+    def _stop_writer(self):
+        """Flush what is queued, then stop the writer thread."""
+        if self._tx_q is None:
+            return
+        self._tx_q.put(None)
+        self._tx_thread.join(timeout=2.0)
+        self._tx_q = None
+        self._tx_thread = None
+
+    def _writer_loop(self, ser, tx_q):
+        failed = False
+        while True:
+            data = tx_q.get()
+            try:
+                if data is None:
+                    return
+                if failed:
+                    continue   # port is gone: drain without waiting on write timeouts
+                try:
+                    ser.write(data)
+                except Exception as e:
+                    print(f'Serial writer failed to send {len(data)} byte(s). Error: {e}')
+                    self.last_error = e
+                    failed = True
+            finally:
+                tx_q.task_done()   # lets flush() return
+
+    def flush(self) -> bool:
+        """
+        Block until every queued write has reached the port. Returns False if
+        a write failed (see last_error), True otherwise.
+        """
+        if self._tx_q is not None:
+            self._tx_q.join()
+        return self.last_error is None
+
+    def _write(self, data):
+        """
+        Hand bytes to the writer thread, or write inline if it is not running.
+        Queued bytes are sent later, so a failure surfaces on the next call:
+        raises the writer's last_error once one has been recorded.
+        """
+        if self.last_error is not None:
+            raise self.last_error
+        if self._tx_q is not None:
+            self._tx_q.put(data)
+        else:
+            self.serial_connection.write(data)
 
     async def send_command_async(self, addr, duty, freq, start_or_stop):
         """Asynchronous method to send a command to the serial device"""
         start_time = time.time()
-        if self.send_command(addr, duty, freq, start_or_stop):
+        # wait for the writer thread: the reply is only meaningful once the bytes are out
+        if self.send_command(addr, duty, freq, start_or_stop) and self.flush():
             print(f'Command sent asynchronously to #{addr} with duty {duty} and freq {freq}, start_or_stop {start_or_stop}')
         else:
             print(f'Failed to send command asynchronously to #{addr} with duty {duty} and freq {freq}')
+            return False
 
         # Wait until it receives a message
         while True:
@@ -41,6 +115,9 @@ class python_serial_api:
         byte3 = 0x80 | ((duty & 0x0F) << 3) | (freq & 0x07)  # 0x80 represents the leading '1'
         return bytearray([byte1, byte2, byte3])
 
+    # send_* return True once the bytes are queued for the writer thread; a
+    # failed write makes the following calls return False (see last_error),
+    # and flush() waits for the queue to reach the port.
     def send_command(self, addr, duty, freq, start_or_stop) -> bool:
         if self.serial_connection is None or not self.connected:
             return False
@@ -49,13 +126,50 @@ class python_serial_api:
         command = self.create_command(int(addr), int(duty), int(freq), int(start_or_stop))
         #command = command + bytearray([0xFF, 0xFF, 0xFF]) * 19  # Padding
         try:
-            self.serial_connection.write(command)
+            self._write(command)
             print(f'Serial sent command to #{addr} with duty {duty} and freq {freq}, start_or_stop {start_or_stop}')
             return True
         except Exception as e:
             print(f'Serial failed to send command to #{addr} with duty {duty} and freq {freq}. Error: {e}')
             return False
 
+    def send_batch(self, cmds) -> bool:
+        """Send (addr, duty, freq, start_or_stop) tuples back-to-back in a single write."""
+        if self.serial_connection is None or not self.connected:
+            return False
+        # One buffer per call: send_batch runs on the GUI and playback threads,
+        # and the queued frame is owned by the writer until it is sent
+        buf = bytearray(_COMMAND.size * len(cmds))
+        for i, (addr, duty, freq, start_or_stop) in enumerate(cmds):
+            if addr < 0 or addr > 127 or duty < 0 or duty > 15 or freq < 0 or freq > 7 or start_or_stop not in [0, 1]:
+                return False
+            _COMMAND.pack_into(buf, i * _COMMAND.size,
+                               ((addr // 16) << 2) | (start_or_stop & 0x01),
+                               0x40 | ((addr % 16) & 0x3F),
+                               0x80 | ((duty & 0x0F) << 3) | (freq & 0x07))
+        try:
+            self._write(buf)
+            print(f'Serial sent batch of {len(cmds)} command(s)')
+            return True
+        except Exception as e:
+            print(f'Serial failed to send batch of {len(cmds)} command(s). Error: {e}')
+            return False
+
+    def send_raw(self, data) -> bool:
+        """
+        Write pre-packed command bytes (multiples of 3, see create_command) as-is.
+        Any buffer object works (bytes, memoryview, ...); it is queued without a
+        copy, so the caller must not modify it afterwards.
+        """
+        if self.serial_connection is None or not self.connected:
+            return False
+        try:
+            self._write(data)
+            return True
+        except Exception as e:
+            print(f'Serial failed to send raw frame of {len(data)} byte(s). Error: {e}')
+            return False
+
     def send_command_list(self, commands) -> bool:
         if self.serial_connection is None or not self.connected:
             return False
@@ -71,7 +185,7 @@ class python_serial_api:
         # padding to 60 bytes
         command = command + bytearray([0xFF, 0xFF, 0xFF]) * (20 - len(commands))
         try:
-            self.serial_connection.write(command)
+            self._write(command)
             print(f'Serial sent command list {commands}')
             return True
         except Exception as e:
@@ -88,6 +202,8 @@ class python_serial_api:
         try:
             # Extract port name from the port_info string
             port_name = port_info.split(' - ')[0]
+            # A writer bound to a previous connection flushes and stops first
+            self._stop_writer()
             
             # Try to open the serial connection
             self.serial_connection = serial.Serial(
@@ -102,6 +218,7 @@ class python_serial_api:
             
             if self.serial_connection.is_open:
                 self.connected = True
+                self._start_writer()
                 print(f'Serial connected to {port_name}')
                 return True
             else:
@@ -117,6 +234,7 @@ class python_serial_api:
         """Disconnect from the serial device"""
         try:
             if self.serial_connection and self.serial_connection.is_open:
+                self._stop_writer()
                 self.serial_connection.close()
                 self.connected = False
                 self.serial_connection = None
@@ -5,11 +5,14 @@ Core utilities and functions for waveform processing.
 
 from .event_data_model import (
     MIME_WAVEFORM,
+    MIME_WAVEFORM_MP,
     common_time_grid,
+    on_uniform_grid,
     resample_to,
     load_csv_waveform,
     save_waveform_to_csv,
     generate_builtin_waveform,
+    event_sidecar_paths,
     HapticEvent,
     EventCategory,
     WaveformData,
@@ -22,16 +25,23 @@ from .utils import (
     safe_eval_equation,
     normalize_signal
 )
+from .kernels import prepare_duty, interp_sorted, compose
 
 __all__ = [
     "MIME_WAVEFORM",
+    "MIME_WAVEFORM_MP",
     "common_time_grid",
+    "on_uniform_grid",
     "resample_to", 
     "load_csv_waveform",
     "save_waveform_to_csv",
     "generate_builtin_waveform",
+    "event_sidecar_paths",
     "safe_eval_equation",
     "normalize_signal",
+    "prepare_duty",
+    "interp_sorted",
+    "compose",
     "HapticEvent",
     "EventCategory", 
     "WaveformData",
@@ -12,22 +12,36 @@ Event Data Model for Universal Haptic Event Designer (Enhanced Parameters)
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, astuple
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Any, Sequence, Tuple
 
 import numpy as np
 from scipy import signal  # waveforms (square/saw/chirp, etc.)
-from scipy.signal import resample_poly  # high-quality resampling
+from scipy.signal import firwin, resample_poly  # high-quality resampling
+
+# Optional orjson (fast JSON with native ndarray support)
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 
 
 # -----------------------------------------------------------------------------
 # Drag & Drop MIME
 # -----------------------------------------------------------------------------
 MIME_WAVEFORM = "application/x-waveform"
+# Same payload as MessagePack; offered alongside the JSON one when msgpack is installed
+MIME_WAVEFORM_MP = "application/x-waveform-msgpack"
+
+# One amplitude point as a record, for single-pass conversion of point lists
+_POINT_DTYPE = np.dtype([("time", "f8"), ("amplitude", "f8")])
+# Stored precision of amplitude samples (time grids stay float64)
+_AMP_DTYPE = np.float32
 
 
 # -----------------------------------------------------------------------------
@@ -39,19 +53,45 @@ def common_time_grid(duration: float, sr: float) -> np.ndarray:
     return np.arange(n, dtype=float) / float(sr)
 
 
+def on_uniform_grid(t: np.ndarray, sr: float) -> bool:
+    """
+    True if t[i] == i / sr to within 5% of a sample period (covers CSV times
+    written with a few decimals), i.e. the samples can drop `t` and use
+    WaveformData's implicit time axis.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim != 1 or not sr > 0:
+        return False
+    step = 1.0 / float(sr)
+    return bool(np.allclose(t, np.arange(t.size) * step, rtol=0.0, atol=0.05 * step))
+
+
 def resample_to(y: np.ndarray, sr_in: float, sr_out: float) -> np.ndarray:
     """
     Resample to target sample rate using polyphase (better spectral fidelity).
-    Keeps the output length proportional to duration.
+    Keeps the output length proportional to duration and the input float dtype.
     """
-    y = np.asarray(y, dtype=float)
+    y = np.asarray(y)
+    if y.dtype.kind != "f":
+        y = y.astype(np.float64)
     if y.size == 0 or float(sr_in) == float(sr_out):
         return y
     up = int(round(sr_out))
     down = int(round(sr_in))
     from math import gcd
     g = gcd(up, down) or 1
-    return resample_poly(y, up // g, down // g).astype(float, copy=False)
+    up, down = up // g, down // g
+    taps = _resample_taps(up, down, y.dtype.str)
+    return resample_poly(y, up, down, window=taps).astype(y.dtype, copy=False)
+
+
+@functools.lru_cache(maxsize=16)
+def _resample_taps(up: int, down: int, dtype: str) -> np.ndarray:
+    """resample_poly's default Kaiser low-pass for (up, down), designed once per ratio."""
+    max_rate = max(up, down)
+    h = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0)).astype(dtype)
+    h.setflags(write=False)
+    return h
 
 
 def load_csv_waveform(path: str, default_sr: float = 1_000.0) -> Tuple[np.ndarray, np.ndarray, float]:
@@ -61,7 +101,7 @@ def load_csv_waveform(path: str, default_sr: float = 1_000.0) -> Tuple[np.ndarra
     """
     arr = np.loadtxt(path, delimiter=",")
     if arr.ndim == 1:  # one column: y
-        y = np.asarray(arr, dtype=float)
+        y = np.asarray(arr, dtype=_AMP_DTYPE)
         sr = float(default_sr)
         t = common_time_grid(duration=(y.size / sr), sr=sr)
         return t, y, sr
@@ -70,7 +110,7 @@ def load_csv_waveform(path: str, default_sr: float = 1_000.0) -> Tuple[np.ndarra
         raise ValueError("CSV must have 1 (y) or 2 (t,y) columns.")
 
     t = np.asarray(arr[:, 0], dtype=float)
-    y = np.asarray(arr[:, 1], dtype=float)
+    y = np.asarray(arr[:, 1], dtype=_AMP_DTYPE)
     dt = np.median(np.diff(t)) if t.size > 1 else 0.0
     sr = 1.0 / dt if dt > 0 else float(default_sr)
     return t, y, sr
@@ -101,37 +141,49 @@ def generate_builtin_waveform(
     """
     t = common_time_grid(duration, sample_rate)
     k = (kind or "Sine").lower()
+    two_pi = 2 * np.pi
 
+    # Whole-array ufuncs on one phase buffer; the periodic shapes are the
+    # closed forms of scipy.signal.square/sawtooth (same values, fewer passes)
     if k in ("sine", "sin"):
-        y = amplitude * np.sin(2 * np.pi * frequency * t)
-    elif k == "square":
-        y = amplitude * signal.square(2 * np.pi * frequency * t, duty=(duty if duty is not None else 0.5))
+        y = np.sin(two_pi * frequency * t)
+        y *= amplitude
+    elif k in ("square", "pwm"):
+        w = min(max(float(duty if duty is not None else 0.5), 0.0), 1.0)
+        ph = np.mod(two_pi * frequency * t, two_pi)
+        y = np.where(np.less(ph, w * two_pi), amplitude, -amplitude)
     elif k == "saw":
-        y = amplitude * signal.sawtooth(2 * np.pi * frequency * t, 1.0)
+        y = np.mod(two_pi * frequency * t, two_pi)
+        y /= np.pi
+        y -= 1.0
+        y *= amplitude
     elif k == "triangle":
-        y = amplitude * signal.sawtooth(2 * np.pi * frequency * t, 0.5)
+        ph = np.mod(two_pi * frequency * t, two_pi)
+        y = np.where(ph < np.pi, ph / (np.pi * 0.5) - 1.0, (np.pi * 1.5 - ph) / (np.pi * 0.5))
+        y *= amplitude
     elif k == "chirp":
-        y = amplitude * signal.chirp(
-            t,
-            f0=(f0 if f0 is not None else frequency),
-            f1=(f1 if f1 is not None else max(1.0, frequency * 2.0)),
-            t1=duration,
-            method="linear",
-        )
+        # linear sweep f0 -> f1 over the duration (scipy.signal.chirp, method="linear")
+        f0_ = float(f0 if f0 is not None else frequency)
+        f1_ = float(f1 if f1 is not None else max(1.0, frequency * 2.0))
+        rate = (f1_ - f0_) / duration
+        y = np.cos(two_pi * (f0_ * t + 0.5 * rate * t * t))
+        y *= amplitude
     elif k == "fm":
         fc = float(frequency)
         fm_hz = float(fm if fm is not None else 5.0)
         beta_ = float(beta if beta is not None else 1.0)
-        y = amplitude * np.sin(2 * np.pi * fc * t + beta_ * np.sin(2 * np.pi * fm_hz * t))
-    elif k == "pwm":
-        y = amplitude * signal.square(2 * np.pi * frequency * t, duty=(duty if duty is not None else 0.5))
+        y = np.sin(two_pi * fm_hz * t)
+        y *= beta_
+        y += two_pi * fc * t
+        np.sin(y, out=y)
+        y *= amplitude
     elif k == "noise":
         rng = np.random.default_rng()
         y = amplitude * rng.uniform(-1.0, 1.0, size=t.size)
     else:
         raise ValueError(f"Unknown oscillator kind: {kind}")
 
-    return t, y.astype(float, copy=False), float(sample_rate)
+    return t, y.astype(_AMP_DTYPE, copy=False), float(sample_rate)
 
 
 # -----------------------------------------------------------------------------
@@ -165,19 +217,203 @@ class ActuatorPattern(Enum):
 # -----------------------------------------------------------------------------
 # Data containers
 # -----------------------------------------------------------------------------
-@dataclass
+class _FrozenPoint(dict):
+    """
+    Read-only {"time", "amplitude"} point. A dict subclass (unlike
+    MappingProxyType) so it still pickles, deep-copies and goes through
+    dataclasses.asdict()/json like a plain dict.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("amplitude points built from the sample arrays are read-only; "
+                        "edit via edit_amp_samples() or assign a new list")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+@dataclass(eq=False)
 class WaveformData:
-    """Container for haptic waveform data."""
+    """
+    Container for haptic waveform data.
+
+    The amplitude envelope is stored as two arrays: time (float64) and
+    amplitude (float32, ample for 4-bit duty output at half the memory).
+    `amplitude` still reads and writes the legacy list of point dicts; the
+    constructor accepts either a point list or a `(t, y)` array pair. When
+    the arrays are the source of truth, reading `amplitude` gives a read-only
+    tuple of read-only point dicts (built on first access): edit the
+    samples via edit_amp_samples() or assign a new list instead.
+    Equality is identity: comparing sample buffers field by field is costly.
+    """
     amplitude: List[Dict[str, float]]        # [{"time": float, "amplitude": float}, ...]
     frequency: List[Dict[str, float]]        # [{"time": float, "frequency": float}, ...]
     duration: float
     sample_rate: float = _DEFAULT_SR
 
+    # Edit counter (not a field: stays out of asdict/JSON). Every attribute
+    # assignment bumps it; call touch() after mutating a list in place.
+    _version = 0
+    # Amplitude storage: point list and/or (t, y) arrays, whichever is current
+    # (unannotated, so @dataclass does not turn them into fields)
+    _amp_pts = None
+    _amp_view = None          # read-only points derived from the arrays
+    _amp_t = None
+    _amp_y = None
+    _amp_implicit_t = False   # t is i / sample_rate, built only on demand
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            if name == "sample_rate" and self._amp_implicit_t:
+                # the implicit time grid (and any points built from it) moved
+                object.__setattr__(self, "_amp_t", None)
+                object.__setattr__(self, "_amp_view", None)
+            object.__setattr__(self, "_version", self._version + 1)
+
+    def touch(self) -> None:
+        """Mark the waveform as edited (for in-place changes to its point lists)."""
+        if self._amp_pts is not None:
+            self._amp_t = self._amp_y = None
+            self._amp_implicit_t = False
+        self._amp_view = None
+        object.__setattr__(self, "_version", self._version + 1)
+
+    # --- amplitude storage ---
+    def set_amplitude_arrays(self, t: Optional[np.ndarray], y: np.ndarray) -> None:
+        """
+        Replace the amplitude envelope with sample arrays (no per-point dicts).
+        Pass `t=None` for samples on the uniform grid i / sample_rate.
+        """
+        y = np.ascontiguousarray(y, dtype=_AMP_DTYPE)
+        if t is not None:
+            t = np.ascontiguousarray(t, dtype=np.float64)
+            if t.shape != y.shape:
+                raise ValueError("t and y must have the same length")
+        if y.ndim != 1:
+            raise ValueError("amplitude samples must be a 1-D array")
+        self._amp_t, self._amp_y, self._amp_pts = t, y, None
+        self._amp_view = None
+        self._amp_implicit_t = t is None
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def amp_samples(self) -> np.ndarray:
+        """Amplitude samples (float32); shared, edit only via edit_amp_samples()."""
+        if self._amp_y is None:
+            pts = self._amp_pts or []
+            arr = np.fromiter(((p["time"], p["amplitude"]) for p in pts),
+                              dtype=_POINT_DTYPE, count=len(pts))
+            self._amp_t = np.ascontiguousarray(arr["time"])
+            self._amp_y = np.ascontiguousarray(arr["amplitude"], dtype=_AMP_DTYPE)
+        return self._amp_y
+
+    def edit_amp_samples(self) -> np.ndarray:
+        """
+        The stored amplitude samples, writable, for in-place edits.
+        Call amplitude_edited() afterwards so derived data is rebuilt.
+        """
+        y = self.amp_samples()
+        if not y.flags.writeable:
+            y = self._amp_y = y.copy()
+        return y
+
+    def amplitude_edited(self, *, uniform: bool = False) -> None:
+        """
+        Commit in-place edits made through edit_amp_samples(): the arrays become
+        the source of truth and the point-dict list is rebuilt on next access.
+        `uniform=True` also moves the samples onto the grid i / sample_rate.
+        """
+        self._amp_pts = self._amp_view = None
+        if uniform:
+            self._amp_t = None
+            self._amp_implicit_t = True
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def amp_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(t, y) arrays (float64, float32) of the amplitude envelope; shared, do not modify."""
+        y = self.amp_samples()
+        if self._amp_t is None:
+            self._amp_t = np.arange(y.size, dtype=np.float64) / float(self.sample_rate)
+        return self._amp_t, y
+
+    def time_for(self, i: int) -> float:
+        """Time (s) of amplitude sample `i`."""
+        if self._amp_implicit_t:
+            return i / float(self.sample_rate)
+        return float(self.amp_arrays()[0][i])
+
+    def to_legacy_dicts(self) -> List[Dict[str, float]]:
+        """Amplitude as [{"time", "amplitude"}, ...] (serialisation / old consumers)."""
+        if self._amp_pts is not None:
+            return self._amp_pts
+        if self._amp_y is None:
+            return []
+        t, y = self.amp_arrays()
+        return [{"time": tt, "amplitude": yy} for tt, yy in zip(t.tolist(), y.tolist())]
+
+    def _get_amplitude(self) -> Sequence[Mapping[str, float]]:
+        if self._amp_pts is not None:
+            return self._amp_pts      # caller's list: in-place edits need touch()
+        if self._amp_view is None:
+            # Derived from the arrays, so in-place edits would be lost: refuse them
+            self._amp_view = tuple(_FrozenPoint(p) for p in self.to_legacy_dicts())
+        return self._amp_view
+
+    def _set_amplitude(self, value) -> None:
+        if isinstance(value, tuple):
+            if len(value) == 2 and not isinstance(value[1], Mapping):
+                self.set_amplitude_arrays(*value)
+                return
+            value = [dict(p) for p in value]   # e.g. a read-only view assigned back
+        self._amp_pts = value if value is not None else []
+        self._amp_view = None
+        self._amp_t = self._amp_y = None
+        self._amp_implicit_t = False
+
+    # --- (de)serialisation ---
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Columnar form: amplitude as {"t": ndarray, "y": ndarray}, with "t"
+        omitted for samples on the implicit i / sample_rate grid.
+        """
+        y = self.amp_samples()
+        amp: Dict[str, Any] = {"y": y}
+        if not self._amp_implicit_t:
+            amp["t"] = self.amp_arrays()[0]
+        return {
+            "amplitude": amp,
+            "frequency": self.frequency,
+            "duration": self.duration,
+            "sample_rate": self.sample_rate,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], base_dir: str = "") -> "WaveformData":
+        """
+        Inverse of to_dict(); also reads the legacy list-of-points amplitude and
+        .npy sidecar references ("y_file"/"t_file", relative to `base_dir`).
+        """
+        d = dict(d)
+        amp = d.pop("amplitude", None) or []
+        wd = cls(amplitude=[], **d)
+        if isinstance(amp, dict):
+            t = _read_column(amp, "t", base_dir, np.float64)
+            y = _read_column(amp, "y", base_dir, _AMP_DTYPE)
+            wd.set_amplitude_arrays(t, y if y is not None else np.empty(0))
+        else:
+            wd.amplitude = amp
+        return wd
+
     # --- small helpers for widgets ---
     def get_amplitude_array(self) -> np.ndarray:
-        if not self.amplitude:
-            return np.array([], dtype=float)
-        return np.array([p["amplitude"] for p in self.amplitude], dtype=float)
+        """Amplitude samples as a read-only view; edit through edit_amp_samples()."""
+        y = self.amp_samples().view()
+        y.flags.writeable = False
+        return y
 
     def get_frequency_array(self) -> np.ndarray:
         if not self.frequency:
@@ -190,6 +426,10 @@ class WaveformData:
         return np.arange(n, dtype=float) / float(self.sample_rate)
 
 
+# Installed after @dataclass so the generated __init__ goes through the setter
+WaveformData.amplitude = property(WaveformData._get_amplitude, WaveformData._set_amplitude)
+
+
 @dataclass
 class ParameterModifications:
     """Waveform parameter modifications (enhanced)."""
@@ -257,15 +497,47 @@ class EventMetadata:
     version:     str = "1.0"
     created_date:  str = ""
     modified_date: str = ""
+    category_name: str | None = None  # free-text label when category is CUSTOM
+
+    # add_tag() membership index (not fields: stay out of asdict/JSON); rebuilt
+    # when `tags` is replaced or its length changed outside add_tag()
+    _tag_src = None
+    _tag_len = 0
+    _tag_set = None
 
     def __post_init__(self):
         self.tags = self.tags or []
+        # Older files encode the free-text label as a "category_name=..." tag;
+        # lift it into the field. Other tags are kept as stored, order and
+        # repeats included.
+        kept = []
+        for t in self.tags:
+            key, sep, val = t.partition("=")
+            if sep and key == "category_name":
+                if self.category_name is None:
+                    self.category_name = val
+            else:
+                kept.append(t)
+        if len(kept) != len(self.tags):
+            self.tags = kept
         ts = datetime.now().isoformat()
         if not self.created_date:
             self.created_date = ts
         if not self.modified_date:
             self.modified_date = self.created_date
 
+    def add_tag(self, tag: str) -> None:
+        """Append `tag` unless already present; the check is a set lookup."""
+        tags = self.tags
+        if tags is None:
+            tags = self.tags = []
+        if self._tag_src is not tags or self._tag_len != len(tags):
+            self._tag_src, self._tag_set = tags, set(tags)
+        if tag not in self._tag_set:
+            tags.append(tag)
+            self._tag_set.add(tag)
+        self._tag_len = len(tags)
+
 
 # -----------------------------------------------------------------------------
 # Main class
@@ -279,6 +551,18 @@ class HapticEvent:
         self.parameter_modifications = ParameterModifications()
         self.actuator_mapping = ActuatorMapping(active_actuators=[])
         self.original_haptic_file: Optional[str] = None
+        # Playback samples memoized by the device thread, keyed on waveform
+        # identity/version and the modifications in effect
+        self._cached_y_signature: Optional[tuple] = None
+        self._cached_y: Optional[Tuple[np.ndarray, float]] = None
+
+    def playback_signature(self) -> Optional[tuple]:
+        """Key that changes whenever the rendered (modified) waveform can change."""
+        wd = self.waveform_data
+        if wd is None:
+            return None
+        # the instance itself (not its id) so a replaced waveform can never alias
+        return (wd, wd._version, astuple(self.parameter_modifications))
 
     # --- factory: built-in oscillators for the Library ---
     @classmethod
@@ -323,7 +607,7 @@ class HapticEvent:
 
         event = cls(name=f"{osc_type} Oscillator", category=EventCategory.CUSTOM)
         event.waveform_data = WaveformData(
-            amplitude=_build_envelope_points(t, y),
+            amplitude=(None, y),   # t is the i / sample_rate grid: keep it implicit
             frequency=[{"time": 0.0, "frequency": frequency}, {"time": duration, "frequency": frequency}],
             duration=float(duration),
             sample_rate=float(sample_rate),
@@ -472,10 +756,9 @@ class HapticEvent:
         """Amplitude after ALL user modifications (ADSR, tremolo, compression, etc.)."""
         if not self.waveform_data:
             return None
-        amp = self.waveform_data.get_amplitude_array()
+        t, amp = self.waveform_data.amp_arrays()
         if amp.size == 0:
             return None
-        t = np.array([pt["time"] for pt in self.waveform_data.amplitude], dtype=float)
 
         p = self.parameter_modifications
         y = amp.copy()
@@ -518,7 +801,7 @@ class HapticEvent:
 
     # --- (de)serialisation ---
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to JSON-serialisable dict (Enum → value)."""
+        """Convert to a serialisable dict (Enum → value, samples as ndarrays)."""
         md = asdict(self.metadata)
         md["category"] = self.metadata.category.value
 
@@ -527,18 +810,40 @@ class HapticEvent:
 
         return {
             "metadata": md,
-            "waveform_data": asdict(self.waveform_data) if self.waveform_data else None,
+            "waveform_data": self.waveform_data.to_dict() if self.waveform_data else None,
             "parameter_modifications": asdict(self.parameter_modifications),
             "actuator_mapping": act,
             "original_haptic_file": self.original_haptic_file,
         }
 
     def save_to_file(self, file_path: str) -> bool:
-        """Persist event as JSON; updates modified_date."""
+        """
+        Persist event as JSON; updates modified_date. Amplitude samples go to
+        binary sidecars next to it (<name>.amp.npy float32, plus <name>.amp_t.npy
+        when the time grid is not uniform) and the JSON only references them.
+        """
         try:
             self.metadata.modified_date = datetime.now().isoformat()
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2)
+            d = self.to_dict()
+            wf = d.get("waveform_data")
+            y_path, t_path = _sidecar_names(file_path)
+            if wf is not None:
+                amp = wf["amplitude"]
+                np.save(y_path, np.asarray(amp["y"], dtype=_AMP_DTYPE))
+                ref = {"y_file": os.path.basename(y_path)}
+                if "t" in amp:
+                    np.save(t_path, np.asarray(amp["t"], dtype=np.float64))
+                    ref["t_file"] = os.path.basename(t_path)
+                elif os.path.exists(t_path):
+                    os.remove(t_path)
+                wf["amplitude"] = ref
+            if _orjson is not None:
+                with open(file_path, "wb") as f:
+                    f.write(_orjson.dumps(d, option=_orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_INDENT_2))
+            else:
+                # same policy as orjson: NaN/inf are written as null
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(_finite_or_none(d), f, indent=2, default=_json_default, allow_nan=False)
             return True
         except Exception as e:
             print(f"Error saving event: {e}")
@@ -548,8 +853,16 @@ class HapticEvent:
     def load_from_file(cls, file_path: str) -> Optional["HapticEvent"]:
         """Load event JSON from disk, rebuilding Enums and dataclasses."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            data = None
+            if _orjson is not None:
+                try:
+                    data = _orjson.loads(raw)
+                except _orjson.JSONDecodeError:
+                    pass   # e.g. NaN/Infinity literals written by older json.dump saves
+            if data is None:
+                data = json.loads(raw.decode("utf-8"))
 
             event = cls()
 
@@ -562,7 +875,7 @@ class HapticEvent:
             # waveform
             wf = data.get("waveform_data")
             if wf:
-                event.waveform_data = WaveformData(**wf)
+                event.waveform_data = WaveformData.from_dict(wf, os.path.dirname(os.path.abspath(file_path)))
 
             # parameter modifications
             pm = data.get("parameter_modifications", {}) or {}
@@ -582,8 +895,45 @@ class HapticEvent:
 
 
 # -----------------------------------------------------------------------------
-# Local utility (for building WaveformData.amplitude)
+# Persistence helpers
 # -----------------------------------------------------------------------------
-def _build_envelope_points(t: np.ndarray, y: np.ndarray) -> List[Dict[str, float]]:
-    """Convert two equal-length arrays into list-of-dicts for WaveformData."""
-    return [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(np.asarray(t, float), np.asarray(y, float))]
\ No newline at end of file
+def _sidecar_names(json_path: str) -> Tuple[str, str]:
+    root = os.path.splitext(json_path)[0]
+    return root + ".amp.npy", root + ".amp_t.npy"
+
+
+def event_sidecar_paths(json_path: str) -> List[str]:
+    """Existing binary sidecar files that belong to a saved event JSON."""
+    return [p for p in _sidecar_names(json_path) if os.path.exists(p)]
+
+
+def _read_column(amp: Dict[str, Any], key: str, base_dir: str, dtype) -> Optional[np.ndarray]:
+    # inline list, or a sidecar .npy (loaded fully: the file may be rewritten on save)
+    if key in amp:
+        return np.asarray(amp[key], dtype=dtype)
+    ref = amp.get(key + "_file")
+    if ref:
+        return np.load(os.path.join(base_dir, ref), allow_pickle=False).astype(dtype, copy=False)
+    return None
+
+
+def _finite_or_none(o):
+    """Copy of a JSON-able tree with NaN/inf floats replaced by None (orjson's output)."""
+    if isinstance(o, float):
+        return o if np.isfinite(o) else None
+    if isinstance(o, dict):
+        return {k: _finite_or_none(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_finite_or_none(v) for v in o]
+    return o
+
+
+def _json_default(o):
+    """json.dump hook for the ndarrays in HapticEvent.to_dict()."""
+    if isinstance(o, np.ndarray):
+        return _finite_or_none(o.tolist())
+    if isinstance(o, np.floating):
+        return _finite_or_none(float(o))
+    if isinstance(o, np.integer):
+        return int(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
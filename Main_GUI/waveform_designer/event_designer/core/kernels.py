@@ -0,0 +1,193 @@
+# kernels.py
+"""
+Numeric kernels for the playback hot paths.
+
+Each kernel has a plain NumPy implementation; when Numba is installed the
+loop version is JIT-compiled instead so the whole pass runs in one sweep.
+"""
+
+import numpy as np
+
+# Optional Numba
+try:
+    from numba import njit as _njit
+except Exception:
+    _njit = None
+
+
+# -----------------------------------------------------------------------------
+# Playback preparation: normalize -> box-decimate -> 4-bit duty codes
+# -----------------------------------------------------------------------------
+def _block_mean(y: np.ndarray, step: int) -> np.ndarray:
+    """Mean of consecutive `step`-sample blocks (last block may be shorter)."""
+    starts = np.arange(0, y.size, step)
+    sums = np.add.reduceat(y, starts)
+    counts = np.diff(np.append(starts, y.size))
+    return sums / counts
+
+
+def _prepare_duty_numpy(y: np.ndarray, step: int, out: np.ndarray) -> np.ndarray:
+    y = np.nan_to_num(y, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    y_min, y_max = float(y.min()), float(y.max())
+    if step > 1:
+        y = _block_mean(y, step)
+    duty = out[:y.size]
+    rng = y_max - y_min
+    if rng < 1e-12:
+        duty[:] = 0 if y_max <= 0.0 else 15
+        return duty
+    u = np.subtract(y, y_min)
+    np.multiply(u, 1.0 / rng, out=u)
+    np.clip(u, 0.0, 1.0, out=u)
+    scaled = np.multiply(u, 15.0)
+    np.rint(scaled, out=scaled)
+    np.copyto(duty, scaled, casting="unsafe")
+    duty[(u > 1e-6) & (duty == 0)] = 1
+    return duty
+
+
+def _prepare_duty_loop(y, step, out):
+    # NaN/Inf are read as 0.0 (no fastmath: it would drop the finiteness tests)
+    n = y.size
+    y_min = np.inf
+    y_max = -np.inf
+    for i in range(n):
+        v = y[i]
+        if not np.isfinite(v):
+            v = 0.0
+        if v < y_min:
+            y_min = v
+        if v > y_max:
+            y_max = v
+
+    m = (n + step - 1) // step
+    rng = y_max - y_min
+    if rng < 1e-12:
+        out[:m] = 0 if y_max <= 0.0 else 15
+        return out[:m]
+
+    inv = 1.0 / rng
+    for j in range(m):
+        lo = j * step
+        hi = min(lo + step, n)
+        acc = 0.0
+        for i in range(lo, hi):
+            w = y[i]
+            if np.isfinite(w):
+                acc += w
+        v = acc / (hi - lo)
+        u = min(max((v - y_min) * inv, 0.0), 1.0)
+        d = np.rint(u * 15.0)
+        if d == 0.0 and u > 1e-6:
+            d = 1.0
+        out[j] = np.uint8(d)
+    return out[:m]
+
+
+_prepare_duty_jit = _njit(cache=True)(_prepare_duty_loop) if _njit is not None else None
+
+
+def prepare_duty(y: np.ndarray, step: int, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Min/max-normalize `y` to [0, 1], decimate by `step` and quantize to duty
+    codes 0..15 (uint8). Non-zero samples never round down to 0.
+    Decimation averages each block of `step` samples (box filter) rather than
+    picking every step-th sample, so content above the tick rate is smoothed
+    out instead of aliasing into the envelope.
+    The codes are written into `out` (uint8, at least ceil(len(y)/step) long)
+    when given and a view of it is returned.
+    The NumPy path may overwrite `y` in place.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    step = max(1, int(step))
+    m = (y.size + step - 1) // step
+    if out is None:
+        out = np.empty(m, dtype=np.uint8)
+    elif out.dtype != np.uint8 or out.size < m:
+        raise ValueError("out must be a uint8 array of at least %d elements" % m)
+    if y.size == 0:
+        return out[:0]
+    if _prepare_duty_jit is not None:
+        return _prepare_duty_jit(np.ascontiguousarray(y), step, out)
+    return _prepare_duty_numpy(y, step, out)
+
+
+# -----------------------------------------------------------------------------
+# Re-gridding: linear interpolation onto a sorted target grid
+# -----------------------------------------------------------------------------
+def _interp_sorted_loop(tg, t, y):
+    # Both grids ascending: walk them together, O(len(tg) + len(t)), no search.
+    # k is the last index with t[k] <= x (numpy's side for repeated t values).
+    m = tg.size
+    n = t.size
+    out = np.empty(m, dtype=np.float64)
+    k = 0
+    for j in range(m):
+        x = tg[j]
+        if x < t[0]:
+            out[j] = y[0]
+        elif x >= t[n - 1]:
+            out[j] = y[n - 1]
+        else:
+            while t[k + 1] <= x:
+                k += 1
+            out[j] = y[k] + (x - t[k]) * (y[k + 1] - y[k]) / (t[k + 1] - t[k])
+    return out
+
+
+_interp_sorted_jit = _njit(cache=True)(_interp_sorted_loop) if _njit is not None else None
+
+
+def interp_sorted(tg: np.ndarray, t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Same result as np.interp(tg, t, y) for ascending `tg` and non-decreasing
+    `t`, including repeated time stamps (a step: x on the repeat takes the
+    last sample there). With Numba the two grids are merged in one pass.
+    """
+    tg = np.asarray(tg, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if _interp_sorted_jit is None or t.size < 2:
+        return np.interp(tg, t, y)
+    return _interp_sorted_jit(np.ascontiguousarray(tg), np.ascontiguousarray(t), np.ascontiguousarray(y))
+
+
+# -----------------------------------------------------------------------------
+# Composition: add / multiply two signals, peak-normalize
+# -----------------------------------------------------------------------------
+def _compose_loop(y1, y2, out, mul):
+    # op and running abs-max in one sweep; returns the peak
+    peak = 0.0
+    for i in range(out.size):
+        v = y1[i] * y2[i] if mul else y1[i] + y2[i]
+        out[i] = v
+        a = abs(v)
+        if a > peak:
+            peak = a
+    return peak
+
+
+_compose_jit = _njit(cache=True)(_compose_loop) if _njit is not None else None
+
+
+def compose(y1: np.ndarray, y2: np.ndarray, mode: str = "add") -> np.ndarray:
+    """
+    `y1 + y2` (mode "add") or `y1 * y2` (anything else) over their common
+    length, divided by its peak when that exceeds 1. Returns a new array.
+    """
+    y1 = np.asarray(y1, dtype=np.float64)
+    y2 = np.asarray(y2, dtype=np.float64)
+    n = min(y1.size, y2.size)
+    y1, y2 = y1[:n], y2[:n]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    mul = mode != "add"
+    if _compose_jit is not None:
+        peak = _compose_jit(np.ascontiguousarray(y1), np.ascontiguousarray(y2), out, mul)
+    else:
+        (np.multiply if mul else np.add)(y1, y2, out=out)
+        peak = max(float(out.max()), -float(out.min()))
+    if peak > 1.0:
+        np.multiply(out, 1.0 / peak, out=out)
+    return out
@@ -7,6 +7,8 @@ import sys
 import os
 import time
 import shutil
+import functools
+import math
 import numpy as np
 from PyQt6.QtCore import Qt, QFileSystemWatcher, QTimer, QThread, pyqtSignal
 from PyQt6.QtGui import QAction, QActionGroup
@@ -20,11 +22,12 @@ from PyQt6.QtWidgets import (
 
 # Import our custom modules
 from .core import (
-    safe_eval_equation, normalize_signal, load_csv_waveform, 
-    resample_to, generate_builtin_waveform, common_time_grid
+    safe_eval_equation, load_csv_waveform, event_sidecar_paths,
+    resample_to, generate_builtin_waveform, common_time_grid, on_uniform_grid,
+    prepare_duty, interp_sorted, compose
 )
 from .ui import (
-    apply_ultra_clean_theme, load_ultra_clean_qss,
+    apply_theme,
     CollapsibleSection, EventLibraryWidget, EditorDropProxy, EventLibraryManager
 )
 
@@ -36,15 +39,64 @@ import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from communication import python_serial_api
 
+# (time, amplitude) record layout used to unpack point lists in one pass
+_POINT_DTYPE = np.dtype([("t", "f8"), ("a", "f8")])
+
+# Built-in categories by their display value (also the combo's base items)
+_CAT_BY_VALUE = {c.value: c for c in EventCategory}
+
+# Oscillator dialog defaults (user prefs are merged over these)
+_OSC_DEFAULTS = {
+    "_default": {"amplitude": 1.0, "frequency": 100.0},
+    "chirp":    {"amplitude": 1.0, "frequency": 100.0, "f0": 50.0, "f1": 200.0},
+    "fm":       {"amplitude": 1.0, "frequency": 100.0, "fm": 5.0, "beta": 1.0},
+    "pwm":      {"amplitude": 1.0, "frequency": 100.0, "duty": 0.5},
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _gen_cached(kind, frequency, amplitude, duration, sample_rate, f0, f1, fm, beta, duty):
+    t, y, sr = generate_builtin_waveform(
+        kind, frequency=frequency, amplitude=amplitude, duration=duration, sample_rate=sample_rate,
+        f0=f0, f1=f1, fm=fm, beta=beta, duty=duty,
+    )
+    t.setflags(write=False); y.setflags(write=False)
+    return t, y, sr
+
+
+def _generate_oscillator(kind, *, frequency, amplitude, duration, sample_rate,
+                         f0=None, f1=None, fm=None, beta=None, duty=None):
+    """
+    generate_builtin_waveform, with repeated drops of the same preset served
+    from an LRU cache. Returns copies, so callers may edit them in place.
+    Noise is random by design and always regenerated.
+    """
+    opt = lambda v: None if v is None else float(v)
+    if (kind or "").lower() == "noise":
+        return generate_builtin_waveform(
+            kind, frequency=frequency, amplitude=amplitude, duration=duration, sample_rate=sample_rate,
+            f0=f0, f1=f1, fm=fm, beta=beta, duty=duty,
+        )
+    t, y, sr = _gen_cached(kind, float(frequency), float(amplitude), float(duration), float(sample_rate),
+                           opt(f0), opt(f1), opt(fm), opt(beta), opt(duty))
+    return t.copy(), y.copy(), sr
+
+
 class WaveformPlaybackThread(QThread):
     finished = pyqtSignal(bool, str)
     log = pyqtSignal(str)
 
+    # Scratch buffers outlive the (one-shot) threads; a run checks a set out
+    # and gives it back, so an overlapping run never shares one.
+    _buffer_pool: list = []
+
     def __init__(self, api, event, actuators, freq_code: int, tick_ms: int = 50):
         super().__init__()
         self.api = api
         self.event = event
-        self.actuators = [int(str(a).lstrip("A").lstrip("a")) for a in (actuators or [0])]
+        # IDs are normalized to ints once here; the hot path uses them as-is
+        self.actuators = tuple(int(str(a).lstrip("A").lstrip("a")) for a in (actuators or [0]))
+        self._stop_cmds = [(addr, 0, 0, 0) for addr in self.actuators if 0 <= addr <= 127]
         self.freq_code = int(freq_code)
         self.tick_ms = int(max(5, tick_ms))
         self._stop = False
@@ -55,78 +107,149 @@ class WaveformPlaybackThread(QThread):
         wd = getattr(self.event, "waveform_data", None)
         if wd is None:
             return np.array([], dtype=float), 0.0
+        # Re-use the samples from the last Play while nothing was edited
+        sig_fn = getattr(self.event, "playback_signature", None)
+        sig = sig_fn() if callable(sig_fn) else None
+        if sig is not None and sig == getattr(self.event, "_cached_y_signature", None):
+            return self.event._cached_y
+        y, sr = self._render_y(wd)
+        if sig is not None and y.size:
+            y.setflags(write=False)
+            self.event._cached_y_signature = sig
+            self.event._cached_y = (y, sr)
+        return y, sr
+
+    def _render_y(self, wd):
+        sr = float(getattr(wd, "sample_rate", 1000.0))
+        gm = getattr(self.event, "get_modified_waveform", None)
+        ga = getattr(wd, "get_amplitude_array", None)
         # 1) waveform modifiée si dispo
         try:
-            gm = getattr(self.event, "get_modified_waveform", None)
             if callable(gm):
-                y = np.asarray(gm(), dtype=float)
-                sr = float(getattr(wd, "sample_rate", 1000.0))
+                y = np.asarray(gm(), dtype=np.float32)   # the model's sample dtype
                 if y.size: return y, sr
         except Exception: pass
         # 2) méthode utilitaire
         try:
-            y = np.asarray(wd.get_amplitude_array(), dtype=float)
-            sr = float(getattr(wd, "sample_rate", 1000.0))
-            if y.size: return y, sr
+            if callable(ga):
+                y = np.asarray(ga(), dtype=np.float32)
+                if y.size: return y, sr
         except Exception: pass
         # 3) reconstruire des points
         try:
             amps = getattr(wd, "amplitude", None) or []
             if amps:
-                t = np.array([p["time"] for p in amps], dtype=float)
-                y = np.array([p["amplitude"] for p in amps], dtype=float)
-                sr = float(getattr(wd, "sample_rate", 1000.0))
-                if t.size > 1 and not np.allclose(np.diff(t), np.diff(t)[0]):
-                    n = max(2, int(round(float(getattr(wd, "duration", t[-1] if t.size else 0.0)) * sr)))
-                    tg = np.linspace(0.0, float(getattr(wd, "duration", t[-1] if t.size else 0.0)), n)
-                    y = np.interp(tg, t, y)
+                # single pass over the point dicts into a (t, a) record array
+                arr = np.fromiter(((p["time"], p["amplitude"]) for p in amps),
+                                  dtype=_POINT_DTYPE, count=len(amps))
+                t, y = arr["t"], arr["a"]
+                d = np.diff(t)
+                # spacing spread against a fixed absolute tolerance (seconds)
+                uniform = d.size == 0 or (d.max() - d.min()) < 1e-9
+                if not uniform:
+                    dur = float(getattr(wd, "duration", t[-1]))
+                    n = max(2, int(round(dur * sr)))
+                    y = interp_sorted(np.linspace(0.0, dur, n), t, y)
                 return y, sr
         except Exception: pass
-        return np.array([], dtype=float), float(getattr(wd, "sample_rate", 1000.0))
+        return np.array([], dtype=float), sr
 
     @staticmethod
-    def _to_unit_nonneg(y: np.ndarray) -> np.ndarray:
-        y = np.asarray(y, dtype=float)
-        y = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
-        if y.size == 0: return y
-        y_min, y_max = float(np.min(y)), float(np.max(y))
-        if abs(y_max - y_min) < 1e-12:
-            return np.zeros_like(y) if y_max <= 0.0 else np.ones_like(y)
-        y = (y - y_min) / (y_max - y_min)
-        return np.clip(y, 0.0, 1.0)
+    def _scratch(bufs: dict, key: str, n: int, dtype) -> np.ndarray:
+        """First `n` items of a pooled buffer, regrown (2x) only when too small."""
+        buf = bufs.get(key)
+        if buf is None or buf.size < n:
+            buf = bufs[key] = np.empty(2 * n, dtype=dtype)
+        return buf[:n]
+
+    def _build_frames(self, duty_seq: np.ndarray) -> np.ndarray:
+        """
+        Pack the whole playback once: one row of 3-byte commands per tick.
+        Address/freq bytes are fixed for the run, so only the duty bits vary.
+        """
+        freq = self.freq_code
+        addrs = [a for a in self.actuators if 0 <= a <= 127]
+        if not addrs or not 0 <= freq <= 7:
+            raise ValueError("Invalid actuator address or freq code")
+        base = np.frombuffer(
+            b"".join(bytes(self.api.create_command(a, 0, freq, 1)) for a in addrs),
+            dtype=np.uint8,
+        ).reshape(len(addrs), 3)
+        frames = np.repeat(base[np.newaxis], duty_seq.size, axis=0)
+        frames[:, :, 2] |= (duty_seq[:, np.newaxis] & 0x0F) << 3
+        return frames.reshape(duty_seq.size, -1)
 
     def run(self):
+        pool = WaveformPlaybackThread._buffer_pool
+        try:
+            bufs = pool.pop()
+        except IndexError:
+            bufs = {}
         try:
             y, sr = self._extract_y()
             if y.size == 0:
                 self.finished.emit(False, "Empty waveform"); return
 
-            y = self._to_unit_nonneg(y)
             step = max(1, int(round(float(sr) * (self.tick_ms / 1000.0))))
-            y = y[::step]
-
-            duty_seq = np.rint(y * 15.0).astype(int)
-            duty_seq = np.where((y > 1e-6) & (duty_seq == 0), 1, duty_seq)
-            duty_seq = np.clip(duty_seq, 0, 15)
-
-            for duty in duty_seq:
+            work = self._scratch(bufs, "y", y.size, np.float64)
+            np.copyto(work, y)
+            duty_buf = self._scratch(bufs, "duty", -(-y.size // step), np.uint8)
+            duty_seq = prepare_duty(work, step, out=duty_buf)
+            # frames are handed to the serial writer, so they stay per-run
+            frames = self._build_frames(duty_seq)
+
+            # pace on absolute deadlines so serial write time does not stretch the tick
+            tick_s = self.tick_ms / 1000.0
+            deadline = time.monotonic()
+            # zero-copy views into the packed frames (never written again)
+            width = frames.shape[1]
+            wire = memoryview(frames.reshape(-1))
+            for i in range(0, len(wire), width):
                 if self._stop: break
-                for addr in self.actuators:
-                    try: self.api.send_command(int(addr), int(duty), self.freq_code, 1)
-                    except Exception as e: self.log.emit(f"send_command error: {e}")
-                self.msleep(self.tick_ms)
-
-            for addr in self.actuators:
-                try: self.api.send_command(int(addr), 0, 0, 0)
-                except Exception: pass
+                try:
+                    ok = self.api.send_raw(wire[i:i + width])
+                except Exception as e:
+                    self.log.emit(f"send_raw error: {e}")
+                    ok = None
+                if ok is False:
+                    # writes are queued: a failed write shows up on the next send
+                    err = getattr(self.api, "last_error", None)
+                    raise RuntimeError(f"Serial write failed: {err}" if err else "Serial write failed")
+                deadline += tick_s
+                sleep_ms = int((deadline - time.monotonic()) * 1000.0)
+                if sleep_ms > 0:
+                    self.msleep(sleep_ms)
+
+            try: self.api.send_batch(self._stop_cmds)
+            except Exception: pass
 
             self.finished.emit(True, "Waveform done")
         except Exception as e:
-            try:
-                for addr in self.actuators: self.api.send_command(int(addr), 0, 0, 0)
+            try: self.api.send_batch(self._stop_cmds)
             except Exception: pass
             self.finished.emit(False, str(e))
+        finally:
+            pool.append(bufs)
+
+
+
+class ComposeThread(QThread):
+    """Resample a signal onto the current waveform's rate and compose, off the GUI thread."""
+    done = pyqtSignal(object)   # composed samples (np.ndarray)
+    failed = pyqtSignal(str)
+
+    def __init__(self, y1: np.ndarray, sr1: float, y2: np.ndarray, sr2: float, mode: str, parent=None):
+        super().__init__(parent)
+        self._y1, self._sr1 = y1, float(sr1)
+        self._y2, self._sr2 = y2, float(sr2)
+        self._mode = mode
 
+    def run(self):
+        try:
+            y2r = resample_to(self._y2, self._sr2, self._sr1)
+            self.done.emit(compose(self._y1, y2r, self._mode))
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class BuiltinParamsDialog(QDialog):
@@ -229,8 +352,12 @@ class BuiltinParamsDialog(QDialog):
 class UniversalEventDesigner(QMainWindow):
     """Main application window for the Universal Haptic Waveform Designer."""
     
+    # Deferred "play this event" (queued, so it runs after the load returns)
+    play_requested = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
+        self.play_requested.connect(self.play_waveform_on_device, Qt.ConnectionType.QueuedConnection)
         self.current_event: HapticEvent | None = None
         self.current_file_path: str | None = None
         self.event_manager = EventLibraryManager()
@@ -239,10 +366,26 @@ class UniversalEventDesigner(QMainWindow):
         self.logs_visible = True
         self.export_watch_dir: str | None = None
         self.export_start_mtime: float = 0.0
+        self._compose_jobs: list = []
+        self._t_cache: dict[tuple[int, float], np.ndarray] = {}
+
+        # Log lines are buffered and flushed to the panel at most every 50 ms
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._compose_thread: ComposeThread | None = None
         
         # File system watcher for Meta Haptics Studio integration
         self.dir_watcher = QFileSystemWatcher(self)
         self.dir_watcher.directoryChanged.connect(self._dir_changed)
+        # Exports fire bursts of change signals; handle once the folder goes quiet
+        self._dir_change_path: str | None = None
+        self._dir_change_timer = QTimer(self)
+        self._dir_change_timer.setSingleShot(True)
+        self._dir_change_timer.setInterval(200)
+        self._dir_change_timer.timeout.connect(self._handle_dir_change)
         
         # Build UI
         self._build_menubar()
@@ -324,16 +467,6 @@ class UniversalEventDesigner(QMainWindow):
         except Exception:
             pass
 
-        acts = []
-        try:
-            am = getattr(event, "actuator_mapping", None)
-            if am and getattr(am, "active_actuators", None):
-                acts = [int(str(a).lstrip("A").lstrip("a")) for a in am.active_actuators]
-        except Exception:
-            acts = []
-        if not acts:
-            acts = [0]   # ← force A0
-
         self._play_thread = WaveformPlaybackThread(
             self.serial_api, event, acts, int(getattr(self, "device_freq_code", 4)), tick_ms=50
         )
@@ -505,17 +638,8 @@ class UniversalEventDesigner(QMainWindow):
         
         splitter.addWidget(self._build_left_panel())
         self.drop_proxy = EditorDropProxy(self)
-        try:
-            if hasattr(self.drop_proxy, "editor") and hasattr(self.drop_proxy.editor, "playRequested"):
-                self.drop_proxy.editor.playRequested.connect(self.play_waveform_on_device)
-        except Exception:
-            pass
 
-        # Cibles / fréquence par défaut + thread holder
-        self.device_targets = [0]
-        self.device_freq_code = 4
-        self._play_thread = None
-        # Relie le signal Play de l’éditeur à la lecture hardware
+        # Relie le signal Play de l’éditeur à la lecture hardware (une seule fois)
         try:
             if hasattr(self.drop_proxy, "editor") and hasattr(self.drop_proxy.editor, "playRequested"):
                 self.drop_proxy.editor.playRequested.connect(self.play_waveform_on_device)
@@ -694,9 +818,8 @@ class UniversalEventDesigner(QMainWindow):
         self.category_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
 
         # Base categories
-        self._base_categories = [c.value for c in EventCategory]
         self.category_combo.clear()
-        self.category_combo.addItems(self._base_categories)
+        self.category_combo.addItems(list(_CAT_BY_VALUE))
 
         # Placeholder text
         self.category_combo.lineEdit().setPlaceholderText(
@@ -731,14 +854,8 @@ class UniversalEventDesigner(QMainWindow):
         """Handle selection of built-in category."""
         if not self.current_event:
             return
-        try:
-            self.current_event.metadata.category = EventCategory(text)
-        except Exception:
-            self.current_event.metadata.category = EventCategory.CUSTOM
-
-        # Remove any previous free-text tag
-        tags = self.current_event.metadata.tags or []
-        self.current_event.metadata.tags = [t for t in tags if not t.startswith("category_name=")]
+        self.current_event.metadata.category = _CAT_BY_VALUE.get(text, EventCategory.CUSTOM)
+        self.current_event.metadata.category_name = None
 
     def _on_category_free_text_committed(self):
         """Handle commit of free-text category."""
@@ -747,21 +864,17 @@ class UniversalEventDesigner(QMainWindow):
         text = (self.category_combo.currentText() or "").strip()
         if not text:
             self.current_event.metadata.category = EventCategory.CUSTOM
-            tags = self.current_event.metadata.tags or []
-            self.current_event.metadata.tags = [t for t in tags if not t.startswith("category_name=")]
+            self.current_event.metadata.category_name = None
             return
 
         # Check if it's a base category
-        if text in getattr(self, "_base_categories", []):
+        if text in _CAT_BY_VALUE:
             self._on_category_base_selected(text)
             return
 
-        # Store as custom category with label in tags
+        # Store as custom category with its own label
         self.current_event.metadata.category = EventCategory.CUSTOM
-        tags = self.current_event.metadata.tags or []
-        tags = [t for t in tags if not t.startswith("category_name=")]
-        tags.append(f"category_name={text}")
-        self.current_event.metadata.tags = tags
+        self.current_event.metadata.category_name = text
 
     def _on_name_changed(self, text: str):
         """Handle name field changes."""
@@ -813,7 +926,7 @@ class UniversalEventDesigner(QMainWindow):
         
     
     def _apply_oscillator(self, osc_name: str, params: dict, comp_mode: str):
-        t2, y2, sr2 = generate_builtin_waveform(
+        _, y2, sr2 = _generate_oscillator(
             osc_name,
             frequency=float(params.get("frequency", 100.0)),
             amplitude=float(params.get("amplitude", 1.0)),
@@ -826,44 +939,61 @@ class UniversalEventDesigner(QMainWindow):
 
         # Replace or no existing waveform
         if comp_mode == "replace" or not (self.current_event and self.current_event.waveform_data):
-            amp_pts = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t2, y2)]
             freq = float(params.get("frequency", 100.0))
             dur = float(params.get("duration", 1.0))
             sr  = float(params.get("sample_rate", 1000.0))
             freq_pts = [{"time": 0.0, "frequency": freq}, {"time": dur, "frequency": freq}]
             evt = HapticEvent(name=f"{osc_name} Oscillator")
-            evt.waveform_data = WaveformData(amp_pts, freq_pts, dur, sr)
+            # oscillators come out on i / sr: implicit time axis, no t buffer or sidecar
+            evt.waveform_data = WaveformData((None, y2), freq_pts, dur, sr)
             self.current_event = evt
             self.current_file_path = None
             self.update_ui()
             self.log_info_message(f"New {osc_name} oscillator (replace)")
             return
 
-        # Compose with existing
-        wf = self.current_event.waveform_data
-        y1 = np.array([p["amplitude"] for p in wf.amplitude], dtype=float)
-        sr1 = float(wf.sample_rate)
-        y2r = resample_to(y2, sr2, sr1)
-        n = min(y1.size, y2r.size)
-        if n == 0:
+        # Compose with existing: resample + compose run on a worker thread,
+        # one job at a time so each composes onto the previous result
+        self._compose_jobs.append((osc_name, y2, sr2, comp_mode))
+        if self._compose_thread is None:
+            self._start_next_compose()
+
+    def _start_next_compose(self):
+        # Only called with no compose thread alive (see _on_compose_finished)
+        while self._compose_jobs:
+            osc_name, y2, sr2, comp_mode = self._compose_jobs.pop(0)
+            wf = self.current_event.waveform_data if self.current_event else None
+            if wf is None:
+                continue
+            sr1 = float(wf.sample_rate)
+            # add or multiply (default) over the common length, peak-normalized in one pass
+            th = ComposeThread(wf.amp_samples().copy(), sr1, y2, sr2,
+                               "add" if comp_mode == "add" else "multiply", parent=self)
+            th.done.connect(functools.partial(self._on_compose_done, wf, wf._version, sr1, osc_name, comp_mode))
+            th.failed.connect(self._on_compose_failed)
+            # Keep the reference until run() has returned; the next job starts from there
+            th.finished.connect(self._on_compose_finished)
+            th.finished.connect(th.deleteLater)
+            self._compose_thread = th
+            th.start()
             return
-        y1 = y1[:n]
-        y2r = y2r[:n]
 
-        if comp_mode == "add":
-            y = y1 + y2r
-        else:  # multiply default
-            y = y1 * y2r
+    def _on_compose_done(self, wf, version, sr1, osc_name, comp_mode, y):
+        current = self.current_event.waveform_data if self.current_event else None
+        if current is not wf or wf._version != version:
+            self.log_info_message(f"Compose {osc_name} dropped: waveform changed meanwhile")
+        elif y.size:
+            wf.set_amplitude_arrays(None, y)   # uniform grid at sr1
+            wf.duration = float(y.size / sr1)
+            self.update_ui()
+            self.log_info_message(f"Composed {osc_name} ({comp_mode})")
 
-        peak = float(np.max(np.abs(y))) if y.size else 1.0
-        if peak > 1.0:
-            y = y / peak
+    def _on_compose_failed(self, msg: str):
+        self.log_info_message(f"Compose error: {msg}")
 
-        t = np.arange(y.size, dtype=float) / sr1
-        wf.amplitude = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t, y)]
-        wf.duration = float(y.size / sr1)
-        self.update_ui()
-        self.log_info_message(f"Composed {osc_name} ({comp_mode})")
+    def _on_compose_finished(self):
+        self._compose_thread = None
+        self._start_next_compose()
 
 
     def _handle_oscillator_payload(self, osc_name: str, *, compose: bool):
@@ -874,56 +1004,47 @@ class UniversalEventDesigner(QMainWindow):
             sr = float(self.current_event.waveform_data.sample_rate)
             dur = float(self.current_event.waveform_data.duration)
         
-        t2, y2, sr2 = generate_builtin_waveform(
+        _, y2, sr2 = _generate_oscillator(
             osc_name, frequency=freq, amplitude=amp, duration=dur, sample_rate=sr
         )
         
         if compose and self.current_event and self.current_event.waveform_data:
             # Composition mode - multiply with existing waveform
             wf = self.current_event.waveform_data
-            y1 = np.array([p["amplitude"] for p in wf.amplitude], dtype=float)
             sr1 = float(wf.sample_rate)
             y2r = resample_to(y2, sr2, sr1)
+            y1 = wf.edit_amp_samples()
             n = min(y1.size, y2r.size)
             if n == 0: 
                 return
-            y1[:n] *= y2r[:n]
-            t1 = np.arange(y1.size) / sr1
-            wf.amplitude = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t1, y1)]
+            head = y1[:n]
+            np.multiply(head, y2r[:n], out=head)   # in place in the stored samples
+            wf.amplitude_edited(uniform=True)   # uniform grid at sr1
             wf.duration = float(y1.size / sr1)
             self.update_ui()
             self.log_info_message(f"Composed {osc_name} (multiply)")
         else:
             # Create new waveform
-            amp_pts = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t2, y2)]
             freq_pts = [{"time": 0.0, "frequency": freq}, {"time": float(dur), "frequency": freq}]
             evt = HapticEvent(name=f"{osc_name} Oscillator")
             evt.waveform_data = WaveformData(
-                amplitude=amp_pts, frequency=freq_pts, duration=float(dur), sample_rate=float(sr)
-            )
+                amplitude=(None, y2), frequency=freq_pts, duration=float(dur), sample_rate=float(sr)
+            )   # uniform grid at sr
             self.current_event = evt
             self.current_file_path = None
             self.update_ui()
             self.log_info_message(f"New {osc_name} oscillator created")
             self.device_targets = [0]
-            QTimer.singleShot(0, lambda: self.play_waveform_on_device(self.current_event))
+            self.play_requested.emit(self.current_event)
         
     
     def _prefill_defaults_for_osc(self, osc_name: str, *, compose: bool) -> dict:
         k = osc_name.lower()
-        d = dict(self._osc_prefs.get(k, {}))
+        d = {**_OSC_DEFAULTS.get(k, _OSC_DEFAULTS["_default"]), **self._osc_prefs.get(k, {})}
         if compose and self.current_event and self.current_event.waveform_data:
             wf = self.current_event.waveform_data
             d.setdefault("duration", float(wf.duration))
             d.setdefault("sample_rate", float(wf.sample_rate))
-        d.setdefault("amplitude", 1.0)
-        d.setdefault("frequency", 100.0)
-        if k == "chirp":
-            d.setdefault("f0", 50.0); d.setdefault("f1", 200.0)
-        elif k == "fm":
-            d.setdefault("fm", 5.0); d.setdefault("beta", 1.0)
-        elif k == "pwm":
-            d.setdefault("duty", 0.5)
         return d
     
     def _handle_oscillator_with_dialog(self, osc_name: str, *, compose: bool, drop_mod: str | None):
@@ -956,33 +1077,33 @@ class UniversalEventDesigner(QMainWindow):
             if compose and self.current_event and self.current_event.waveform_data:
                 # Composition mode
                 wf = self.current_event.waveform_data
-                y1 = np.array([p["amplitude"] for p in wf.amplitude], dtype=float)
                 sr1 = float(wf.sample_rate)
                 y2r = resample_to(y2, sr2, sr1)
+                y1 = wf.edit_amp_samples()
                 n = min(y1.size, y2r.size)
                 if n == 0: 
                     return
-                y1[:n] *= y2r[:n]
-                t1 = np.arange(y1.size) / sr1
-                wf.amplitude = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t1, y1)]
+                head = y1[:n]
+                np.multiply(head, y2r[:n], out=head)   # in place in the stored samples
+                wf.amplitude_edited(uniform=True)   # uniform grid at sr1
                 wf.duration = float(y1.size / sr1)
                 self.update_ui()
                 self.log_info_message("Composed CSV waveform (multiply)")
             else:
                 # New waveform
                 dur = float(t2[-1] - t2[0]) if t2.size > 1 else (y2.size / sr2)
-                amp_pts = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t2, y2)]
                 freq_pts = [{"time": 0.0, "frequency": 0.0}, {"time": float(dur), "frequency": 0.0}]
                 evt = HapticEvent(name=os.path.splitext(os.path.basename(path))[0])
                 evt.waveform_data = WaveformData(
-                    amplitude=amp_pts, frequency=freq_pts, duration=float(dur), sample_rate=float(sr2)
+                    amplitude=(None if on_uniform_grid(t2, sr2) else t2, y2),
+                    frequency=freq_pts, duration=float(dur), sample_rate=float(sr2)
                 )
                 self.current_event = evt
                 self.current_file_path = None
                 self.update_ui()
                 self.log_info_message(f"Loaded CSV: {os.path.basename(path)}")
                 self.device_targets = [0]
-                QTimer.singleShot(0, lambda: self.play_waveform_on_device(self.current_event))
+                self.play_requested.emit(self.current_event)
         else:
             # Load haptic event file
             evt = HapticEvent.load_from_file(path)
@@ -997,10 +1118,10 @@ class UniversalEventDesigner(QMainWindow):
         self.logs_visible = not self.logs_visible
         self.logs_group.setVisible(self.logs_visible)
         self.toggle_logs_action.setText("Hide Logs" if self.logs_visible else "Show Logs")
-        self.update()
 
     def clear_log(self):
         """Clear the log text."""
+        self._log_buf.clear()
         self.info_text.clear()
 
     def scan_devices(self):
@@ -1011,14 +1132,19 @@ class UniversalEventDesigner(QMainWindow):
             devices = []
             self.log_info_message(f"Error scanning devices: {e}")
 
-        # rebuild the submenu
-        self._dev_ports_menu.clear()
-        self._dev_ports_actions.clear()
+        # update the submenu in place: only vanished/new ports touch QActions
+        present = set(devices)
+        for p in [p for p in self._dev_ports_actions if p not in present]:
+            act = self._dev_ports_actions.pop(p)
+            self._dev_ports_menu.removeAction(act)
+            self._dev_ports_group.removeAction(act)
+            act.deleteLater()
         for p in devices:
-            act = QAction(p, self, checkable=True)
-            self._dev_ports_menu.addAction(act)
-            self._dev_ports_group.addAction(act)
-            self._dev_ports_actions[p] = act
+            if p not in self._dev_ports_actions:
+                act = QAction(p, self, checkable=True)
+                self._dev_ports_menu.addAction(act)
+                self._dev_ports_group.addAction(act)
+                self._dev_ports_actions[p] = act
 
         if devices:
             sel = self.selected_port if self.selected_port in devices else devices[0]
@@ -1060,8 +1186,18 @@ class UniversalEventDesigner(QMainWindow):
     def log_info_message(self, message: str):
         """Log an informational message."""
         ts = time.strftime("%H:%M:%S")
-        self.info_text.append(f"<span style='color:#A0AEC0;'>[{ts}]</span> {message}")
-        self.info_text.verticalScrollBar().setValue(self.info_text.verticalScrollBar().maximum())
+        self._log_buf.append(f"<span style='color:#A0AEC0;'>[{ts}]</span> {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append the buffered log lines in one go and scroll to the end once."""
+        if not self._log_buf:
+            return
+        self.info_text.append("<br>".join(self._log_buf))
+        self._log_buf.clear()
+        bar = self.info_text.verticalScrollBar()
+        bar.setValue(bar.maximum())
 
     # Meta Haptics Studio integration
     def create_with_meta_studio(self):
@@ -1093,16 +1229,27 @@ class UniversalEventDesigner(QMainWindow):
         self.log_info_message(f"Meta Haptics Studio launched – waiting for .haptic in \"{watch_dir}\"…")
 
     def _dir_changed(self, path: str):
-        """Handle directory change events from file watcher."""
+        """Coalesce directory change events from file watcher (200 ms debounce)."""
         if path != self.export_watch_dir: 
             return
+        self._dir_change_path = path
+        self._dir_change_timer.start()
+
+    def _handle_dir_change(self):
+        """Look for a fresh .haptic export once the watched folder is quiet."""
+        path, self._dir_change_path = self._dir_change_path, None
+        if path is None or path != self.export_watch_dir: 
+            return
         
-        candidates = [os.path.join(path, f) for f in os.listdir(path) if f.lower().endswith(".haptic")]
+        # scandir entries cache their stat: one stat per candidate file
+        with os.scandir(path) as it:
+            candidates = [(e.stat().st_mtime, e.path) for e in it
+                          if e.name.lower().endswith(".haptic") and e.is_file()]
         if not candidates: 
             return
         
-        latest = max(candidates, key=os.path.getmtime)
-        if os.path.getmtime(latest) < self.export_start_mtime: 
+        mtime, latest = max(candidates)
+        if mtime < self.export_start_mtime: 
             return
         
         self.dir_watcher.removePath(path)
@@ -1164,6 +1311,8 @@ class UniversalEventDesigner(QMainWindow):
                 dst = os.path.join(custom_dir, os.path.basename(path))
                 try: 
                     shutil.copy2(path, dst)
+                    for side in event_sidecar_paths(path):
+                        shutil.copy2(side, custom_dir)
                     self.log_info_message(f"Copied to library/customized: {os.path.basename(dst)}")
                 except Exception as e: 
                     self.log_info_message(f"Failed to copy into library/customized: {e}")
@@ -1201,19 +1350,31 @@ class UniversalEventDesigner(QMainWindow):
         try:
             t, y, sr = load_csv_waveform(path)
             dur = float(t[-1]) if t.size else (len(y) / sr if sr > 0 else 0.0)
-            amp = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t, y)]
             freq = (self.current_event.waveform_data.frequency
                     if self.current_event.waveform_data and self.current_event.waveform_data.frequency
                     else [{"time": 0.0, "frequency": 0.0}, {"time": dur, "frequency": 0.0}])
-            self.current_event.waveform_data = WaveformData(amp, freq, dur, sr)
-            tags = self.current_event.metadata.tags or []
-            if "imported-csv" not in tags: 
-                self.current_event.metadata.tags = tags + ["imported-csv"]
+            # regular CSV grids use the implicit time axis (no t buffer / sidecar)
+            self.current_event.waveform_data = WaveformData(
+                (None if on_uniform_grid(t, sr) else t, y), freq, dur, sr
+            )
+            self.current_event.metadata.add_tag("imported-csv")
             self.update_ui()
             self.log_info_message(f"CSV imported: {os.path.basename(path)}")
         except Exception as e:
             QMessageBox.critical(self, "Import failed", str(e))
 
+    def _time_grid(self, n: int, sr: float) -> np.ndarray:
+        """np.arange(n) / sr, kept (read-only) for the last few (n, sr) pairs."""
+        key = (n, sr)
+        t = self._t_cache.get(key)
+        if t is None:
+            if len(self._t_cache) >= 8:
+                self._t_cache.pop(next(iter(self._t_cache)))
+            t = np.arange(n, dtype=float) / sr
+            t.setflags(write=False)
+            self._t_cache[key] = t
+        return t
+
     def generate_from_math(self):
         """Generate waveform from mathematical equation."""
         if not self.current_event: 
@@ -1230,26 +1391,27 @@ class UniversalEventDesigner(QMainWindow):
             sr = max(200.0, min(sr, 50000.0))
             
             n = int(round(sr * dur))
-            t = np.arange(n, dtype=float) / sr
+            t = self._time_grid(n, sr)
             expr = self.math_equation.text().strip()
             
             if not expr: 
                 raise ValueError("Equation is empty.")
             
-            y = safe_eval_equation(expr, {"t": t, "f": f, "A": 1.0, "phi": 0.0})
-            y = normalize_signal(y)
+            # evaluated on the float64 grid, stored as float32 (the model's sample dtype)
+            y = np.asarray(safe_eval_equation(expr, {"t": t, "f": f, "A": 1.0, "phi": 0.0}), dtype=np.float32)
             
-            if not np.isfinite(y).all(): 
+            # One reduction gives the peak and the finiteness check (NaN/Inf propagate)
+            peak = max(float(y.max()), -float(y.min())) if y.size else 0.0
+            if not math.isfinite(peak): 
                 raise ValueError("Signal contains NaN/Inf.")
+            if peak > 1e-12:
+                y *= 1.0 / peak
             
-            amp = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t, y)]
             freq = [{"time": 0.0, "frequency": f}, {"time": dur, "frequency": f}]
-            self.current_event.waveform_data = WaveformData(amp, freq, dur, sr)
+            # t is the i / sr grid: store on the implicit axis
+            self.current_event.waveform_data = WaveformData((None, y), freq, dur, sr)
             
-            tags = getattr(self.current_event.metadata, "tags", None) or []
-            if "generated" not in tags: 
-                tags.append("generated")
-            self.current_event.metadata.tags = tags
+            self.current_event.metadata.add_tag("generated")
             
             self.update_ui()
             self.log_info_message("Waveform generated from equation")
@@ -1275,21 +1437,12 @@ class UniversalEventDesigner(QMainWindow):
             self.name_edit.setText(self.current_event.metadata.name)
 
         # Update category
-        cat_text = self.current_event.metadata.category.value
-        tags = self.current_event.metadata.tags or []
-        for t in tags:
-            if t.startswith("category_name="):
-                cat_text = t.split("=", 1)[1]
-                break
-
-        base_list = getattr(self, "_base_categories", None)
-        if base_list is None:
-            base_list = [c.value for c in EventCategory]
-            self._base_categories = base_list
+        md = self.current_event.metadata
+        cat_text = md.category_name or md.category.value
 
         if hasattr(self, "category_combo"):
             idx = self.category_combo.findText(cat_text)
-            if cat_text in base_list and idx >= 0:
+            if cat_text in _CAT_BY_VALUE and idx >= 0:
                 self.category_combo.setCurrentIndex(idx)
             else:
                 self.category_combo.setEditText(cat_text)
@@ -1330,14 +1483,16 @@ class UniversalEventDesigner(QMainWindow):
                 self._play_thread.wait(1200)
         except Exception:
             pass
+        self._compose_jobs.clear()
+        if self._compose_thread is not None:
+            self._compose_thread.wait(2000)
         super().closeEvent(e)
 
 
 def main():
     """Main application entry point."""
     app = QApplication(sys.argv)
-    apply_ultra_clean_theme(app)
-    load_ultra_clean_qss(app)
+    apply_theme(app)
     
     app.setApplicationName("Universal Haptic Waveform Designer")
     app.setApplicationVersion("2.3")
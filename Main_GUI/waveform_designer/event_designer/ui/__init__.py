@@ -3,7 +3,10 @@
 User interface components and theming for the haptic waveform designer.
 """
 
-from .theme import apply_ultra_clean_theme, load_ultra_clean_qss
+from .theme import (
+    apply_theme, apply_ultra_clean_theme, load_ultra_clean_qss,
+    build_qss, get_qss_text, style_primary_button,
+)
 from .widgets import (
     CollapsibleSection,
     LibraryTree,
@@ -13,8 +16,12 @@ from .widgets import (
 )
 
 __all__ = [
+    "apply_theme",
     "apply_ultra_clean_theme",
     "load_ultra_clean_qss",
+    "build_qss",
+    "get_qss_text",
+    "style_primary_button",
     "CollapsibleSection",
     "LibraryTree", 
     "EventLibraryManager",
@@ -0,0 +1,55 @@
+# _theme_qss.py
+# Generated by `python theme.py` from the templates in theme.py; do not edit.
+
+SOURCE_DIGEST = "7dd28ce0f8b8c6423a4fefd4904fd0f8dba5d938"
+
+QSS = (
+    'QAbstractButton:focus,QAbstractItemView{outline:0;}'
+    'QWidget{background:#FAFBFC;color:#0F172A;font-size:13px;font-family:-apple-system,"SF Pro Text","Segoe UI Variable","Segoe UI",Roboto,Inter,"Helvetica Neue",Arial,sans-serif;}'
+    'QLabel{color:#475569;font-weight:500;}'
+    'QGroupBox{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:10px;margin-top:12px;padding:10px 12px 12px 12px;}'
+    'QGroupBox::title{subcontrol-origin:margin;left:10px;padding:0 6px;color:#0F172A;background:#FFFFFF;font-weight:700;}'
+    'QPushButton,QToolButton,QLineEdit,QComboBox,QSpinBox,QDoubleSpinBox,QDateEdit,QTimeEdit{height:28px;border:1px solid #E2E8F0;border-radius:8px;background:#FFFFFF;padding:0 10px;selection-background-color:#3B82F6;selection-color:#FFFFFF;}'
+    'QLineEdit,QComboBox,QSpinBox,QDoubleSpinBox{color:#0F172A;}'
+    'QLineEdit:focus,QComboBox:focus,QSpinBox:focus,QDoubleSpinBox:focus,QDateEdit:focus,QTimeEdit:focus{border:2px solid #3B82F6;padding:0 9px;}'
+    'QPushButton{font-weight:600;color:#0F172A;}'
+    'QPushButton:hover{background:#F1F5F9;border-color:#CBD5E1;}'
+    'QPushButton:pressed{background:#E5E7EB;}'
+    'QPushButton:disabled{color:#94A3B8;border-color:#E2E8F0;background:#FFFFFF;}'
+    'QToolButton{padding:0 6px;border-radius:6px;}'
+    'QToolButton:hover{background:#F1F5F9;}'
+    'QComboBox::drop-down{border:0;width:18px;}'
+    'QComboBox QAbstractItemView{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:8px;padding:4px 0;selection-background-color:#3B82F6;selection-color:#FFFFFF;}'
+    'QComboBox QAbstractItemView::item:hover{background:#F1F5F9;color:#0F172A;}'
+    'QAbstractSpinBox::up-button,QAbstractSpinBox::down-button{width:16px;border:0;margin:0;}'
+    'QTabWidget::pane{border:1px solid #E2E8F0;border-radius:10px;background:#FFFFFF;}'
+    'QTabBar::tab{border:1px solid #E2E8F0;border-bottom:none;border-top-left-radius:8px;border-top-right-radius:8px;padding:7px 14px;margin-right:2px;background:#F8FAFC;color:#475569;font-weight:600;}'
+    'QTabBar::tab:selected{background:#FFFFFF;color:#0F172A;}'
+    'QTabBar::tab:hover{background:#F1F5F9;color:#0F172A;}'
+    'QListWidget,QTreeWidget,QTextEdit,QPlainTextEdit{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:8px;padding:8px;}'
+    'QListView::item:hover,QTreeView::item:hover,QTableView::item:hover{background:#F1F5F9;color:#0F172A;}'
+    'QTableView{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:8px;gridline-color:#E2E8F0;selection-background-color:#3B82F6;selection-color:#FFFFFF;}'
+    'QHeaderView::section{background:#F8FAFC;color:#475569;border:1px solid #E2E8F0;padding:6px 8px;font-weight:600;}'
+    'QSlider::groove:horizontal{height:4px;background:#E2E8F0;border-radius:2px;}'
+    'QSlider::handle:horizontal{width:16px;height:16px;margin:-6px 0;border-radius:8px;background:#3B82F6;}'
+    'QSlider::handle:horizontal:hover{background:#3B82F6;}'
+    'QCheckBox,QRadioButton{spacing:8px;}'
+    'QCheckBox::indicator,QRadioButton::indicator{width:16px;height:16px;border:1px solid #E2E8F0;border-radius:3px;background:#FFFFFF;}'
+    'QRadioButton::indicator{border-radius:8px;}'
+    'QCheckBox::indicator:checked,QRadioButton::indicator:checked{border-color:#3B82F6;background:#3B82F6;}'
+    'QSplitter::handle{background:#E2E8F0;width:4px;height:4px;border-radius:2px;}'
+    'QSplitter::handle:hover{background:#F1F5F9;}'
+    'QScrollBar:vertical{background:transparent;width:10px;margin:2px;}'
+    'QScrollBar::handle:vertical{background:#CBD5E1;border-radius:5px;min-height:28px;}'
+    'QScrollBar::handle:vertical:hover{background:#A7B4C6;}'
+    'QScrollBar:horizontal{background:transparent;height:10px;margin:2px;}'
+    'QScrollBar::handle:horizontal{background:#CBD5E1;border-radius:5px;min-width:28px;}'
+    'QScrollBar::add-line,QScrollBar::sub-line{width:0;height:0;}'
+    'QMenu{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:8px;padding:6px 0;}'
+    'QMenu::item{padding:6px 12px;border-radius:6px;color:#0F172A;}'
+    'QMenu::item:selected{background:#F1F5F9;color:#0F172A;}'
+    'QToolTip{background:#0F172A;color:#FFFFFF;border:0;padding:6px 8px;border-radius:6px;opacity:220;}'
+    'QStatusBar{background:#FFFFFF;border:1px solid #E2E8F0;border-radius:8px;padding:4px 8px;}'
+    'QProgressBar{border:1px solid #E2E8F0;border-radius:8px;background:#FFFFFF;padding:2px;text-align:center;}'
+    'QProgressBar::chunk{background-color:#3B82F6;border-radius:6px;}'
+)
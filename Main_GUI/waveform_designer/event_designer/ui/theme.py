@@ -4,270 +4,423 @@ Modern, minimal theme + QSS for the Haptic Waveform Designer.
 Hover states now use soft gray instead of blue.
 """
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPalette, QColor
-
-# Palette tokens
-_ACCENT   = "#3B82F6"  # blue-500 (kept for focus/selection)
-_ACCENT_D = "#1D4ED8"  # blue-700
-_TEXT     = "#0F172A"  # slate-900
-_SUBTEXT  = "#475569"  # slate-600
-_BORDER   = "#E2E8F0"  # slate-200
-_PANEL    = "#FFFFFF"
-_CANVAS   = "#FAFBFC"
-_ALT      = "#F8FAFC"
-_PLACE    = "#94A3B8"
-_DANGER   = "#EF4444"
-
-# New: neutral hover tones
-_HOVER_BG = "#F1F5F9"  # light gray hover
-_HOVER_BG_D = "#E5E7EB"  # pressed/active gray
-_HOVER_BORDER = "#CBD5E1"  # slightly darker border on hover
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import re
+import string
+from typing import TYPE_CHECKING
+
+# Qt is imported inside the functions that touch it, so the QSS text
+# (get_qss_text) is available without loading QtGui/QtWidgets
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
+
+# Palette tokens (light) as 0xRRGGBB. The QSS template below refers to them by key.
+_LIGHT = {
+    "ACCENT":   0x3B82F6,  # blue-500 (kept for focus/selection)
+    "ACCENT_D": 0x1D4ED8,  # blue-700
+    "TEXT":     0x0F172A,  # slate-900
+    "SUBTEXT":  0x475569,  # slate-600
+    "BORDER":   0xE2E8F0,  # slate-200
+    "PANEL":    0xFFFFFF,
+    "CANVAS":   0xFAFBFC,
+    "ALT":      0xF8FAFC,
+    "PLACE":    0x94A3B8,
+    "DANGER":   0xEF4444,
+    # neutral hover tones
+    "HOVER_BG":     0xF1F5F9,  # light gray hover
+    "HOVER_BG_D":   0xE5E7EB,  # pressed/active gray
+    "HOVER_BORDER": 0xCBD5E1,  # slightly darker border on hover
+}
+
+def _qc(v: int):
+    from PyQt6.QtGui import QColor
+    return QColor((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+
+# QPalette role -> 0xRRGGBB (or a Qt.GlobalColor name), resolved to Qt
+# objects once by _palette_pairs()
+_PAL_ROLES = (
+    ("Window",          _LIGHT["CANVAS"]),
+    ("Base",            _LIGHT["PANEL"]),
+    ("AlternateBase",   _LIGHT["ALT"]),
+    ("Text",            _LIGHT["TEXT"]),
+    ("WindowText",      _LIGHT["TEXT"]),
+    ("ButtonText",      _LIGHT["TEXT"]),
+    ("ToolTipText",     _LIGHT["PANEL"]),
+    ("Button",          _LIGHT["PANEL"]),
+    ("Highlight",       _LIGHT["ACCENT"]),
+    ("HighlightedText", "white"),
+    ("PlaceholderText", _LIGHT["PLACE"]),
+    ("BrightText",      _LIGHT["DANGER"]),
+)
 
-def apply_ultra_clean_theme(app: QApplication) -> None:
-    try: app.setStyle("Fusion")
-    except Exception: pass
+
+@functools.lru_cache(maxsize=1)
+def _palette_pairs() -> tuple:
+    # Built once from the ints (no hex-string parsing); every apply reuses them
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QPalette
+    return tuple(
+        (getattr(QPalette.ColorRole, role),
+         getattr(Qt.GlobalColor, v) if isinstance(v, str) else _qc(v))
+        for role, v in _PAL_ROLES
+    )
+
+def _apply_palette(app: QApplication) -> None:
+    from PyQt6.QtGui import QPalette
+    from PyQt6.QtWidgets import QStyleFactory
+
+    # setStyle rebuilds the style even when it is unchanged; do it once per app
+    if not app.property("_fusion_set"):
+        if "Fusion" in QStyleFactory.keys():
+            app.setStyle("Fusion")
+        app.setProperty("_fusion_set", True)
 
     pal = QPalette()
-    pal.setColor(QPalette.ColorRole.Window,        QColor(_CANVAS))
-    pal.setColor(QPalette.ColorRole.Base,          QColor(_PANEL))
-    pal.setColor(QPalette.ColorRole.AlternateBase, QColor(_ALT))
-    pal.setColor(QPalette.ColorRole.Text,          QColor(_TEXT))
-    pal.setColor(QPalette.ColorRole.WindowText,    QColor(_TEXT))
-    pal.setColor(QPalette.ColorRole.ButtonText,    QColor(_TEXT))
-    pal.setColor(QPalette.ColorRole.ToolTipText,   QColor(_PANEL))
-    pal.setColor(QPalette.ColorRole.Button,        QColor(_PANEL))
-    pal.setColor(QPalette.ColorRole.Highlight,     QColor(_ACCENT))
-    pal.setColor(QPalette.ColorRole.HighlightedText, QColor("#FFFFFF"))
-    pal.setColor(QPalette.ColorRole.PlaceholderText, QColor(_PLACE))
-    pal.setColor(QPalette.ColorRole.BrightText,    QColor(_DANGER))
+    for role, color in _palette_pairs():
+        pal.setColor(role, color)
     app.setPalette(pal)
 
-def load_ultra_clean_qss(app: QApplication) -> None:
-    qss = f"""
-    /* ---- Base ---- */
-    * {{ outline: 0; }}
-    QWidget {{
-        background: {_CANVAS};
-        color: {_TEXT};
+# The sheet as named fragments of plain CSS with $TOKEN placeholders, so a
+# window that only needs some widget families can build a smaller sheet.
+_QSS_FRAGMENTS = {
+    "base": string.Template("""
+    /* no focus outline where Qt would draw one; focus shows as the accent border */
+    QAbstractButton:focus, QAbstractItemView { outline: 0; }
+    QWidget {
+        background: $CANVAS;
+        color: $TEXT;
         font-size: 13px;
         font-family: -apple-system, "SF Pro Text", "Segoe UI Variable", "Segoe UI",
                      Roboto, Inter, "Helvetica Neue", Arial, sans-serif;
-    }}
-    QLabel {{ color: {_SUBTEXT}; font-weight: 500; }}
-
-    /* ---- Cards ---- */
-    QGroupBox {{
-        background: {_PANEL};
-        border: 1px solid {_BORDER};
+    }
+    QLabel { color: $SUBTEXT; font-weight: 500; }
+    """),
+    "cards": string.Template("""
+    QGroupBox {
+        background: $PANEL;
+        border: 1px solid $BORDER;
         border-radius: 10px;
         margin-top: 12px;
         padding: 10px 12px 12px 12px;
-    }}
-    QGroupBox::title {{
+    }
+    QGroupBox::title {
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 6px;
-        color: {_TEXT};
-        background: {_PANEL};
+        color: $TEXT;
+        background: $PANEL;
         font-weight: 700;
-    }}
-
-    /* ---- Inputs & Buttons ---- */
+    }
+    """),
+    "inputs": string.Template("""
     QPushButton, QToolButton,
-    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit, QTimeEdit {{
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit, QTimeEdit {
         height: 28px;
-        border: 1px solid {_BORDER};
+        border: 1px solid $BORDER;
         border-radius: 8px;
         background: #FFFFFF;
         padding: 0 10px;
-        selection-background-color: {_ACCENT};
+        selection-background-color: $ACCENT;
         selection-color: #FFFFFF;
-    }}
-    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{ color: {_TEXT}; }}
+    }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox { color: $TEXT; }
 
     /* Focus (keep accent for accessibility) */
     QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus,
-    QDateEdit:focus, QTimeEdit:focus {{
-        border: 2px solid {_ACCENT};
+    QDateEdit:focus, QTimeEdit:focus {
+        border: 2px solid $ACCENT;
         padding: 0 9px;
-    }}
+    }
 
     /* Buttons — neutral hover */
-    QPushButton {{ font-weight: 600; color: {_TEXT}; }}
-    QPushButton:hover {{ background: {_HOVER_BG}; border-color: {_HOVER_BORDER}; }}
-    QPushButton:pressed {{ background: {_HOVER_BG_D}; }}
-    QPushButton:disabled {{ color: {_PLACE}; border-color: {_BORDER}; background: #FFFFFF; }}
-
-    /* Primary button (opt-in via objectName) */
-    QPushButton#primaryButton {{
-        background: {_ACCENT};
-        border: 1px solid {_ACCENT};
-        color: #FFFFFF;
-    }}
-    QPushButton#primaryButton:hover  {{ background: {_ACCENT_D}; border-color: {_ACCENT_D}; }}
-    QPushButton#primaryButton:pressed{{ background: {_ACCENT_D}; }}
+    QPushButton { font-weight: 600; color: $TEXT; }
+    QPushButton:hover { background: $HOVER_BG; border-color: $HOVER_BORDER; }
+    QPushButton:pressed { background: $HOVER_BG_D; }
+    QPushButton:disabled { color: $PLACE; border-color: $BORDER; background: #FFFFFF; }
 
     /* Tool buttons — neutral hover */
-    QToolButton {{ padding: 0 6px; border-radius: 6px; }}
-    QToolButton:hover {{ background: {_HOVER_BG}; }}
+    QToolButton { padding: 0 6px; border-radius: 6px; }
+    QToolButton:hover { background: $HOVER_BG; }
 
     /* Combo popup */
-    QComboBox::drop-down {{ border: 0; width: 18px; }}
-    QComboBox QAbstractItemView {{
+    QComboBox::drop-down { border: 0; width: 18px; }
+    QComboBox QAbstractItemView {
         background: #FFFFFF;
-        border: 1px solid {_BORDER};
+        border: 1px solid $BORDER;
         border-radius: 8px;
         padding: 4px 0;
-        selection-background-color: {_ACCENT}; /* selection remains accent */
+        selection-background-color: $ACCENT; /* selection remains accent */
         selection-color: #FFFFFF;
-    }}
+    }
     /* Neutral hover rows in popups */
-    QComboBox QAbstractItemView::item:hover {{
-        background: {_HOVER_BG};
-        color: {_TEXT};
-    }}
+    QComboBox QAbstractItemView::item:hover {
+        background: $HOVER_BG;
+        color: $TEXT;
+    }
 
     /* Spin arrows */
-    QAbstractSpinBox::up-button, QAbstractSpinBox::down-button {{
+    QAbstractSpinBox::up-button, QAbstractSpinBox::down-button {
         width: 16px; border: 0; margin: 0;
-    }}
-
-    /* ---- Tabs ---- */
-    QTabWidget::pane {{
-        border: 1px solid {_BORDER};
+    }
+    """),
+    "tabs": string.Template("""
+    QTabWidget::pane {
+        border: 1px solid $BORDER;
         border-radius: 10px;
         background: #FFFFFF;
-    }}
-    QTabBar::tab {{
-        border: 1px solid {_BORDER};
+    }
+    QTabBar::tab {
+        border: 1px solid $BORDER;
         border-bottom: none;
         border-top-left-radius: 8px;
         border-top-right-radius: 8px;
         padding: 7px 14px;
         margin-right: 2px;
         background: #F8FAFC;
-        color: {_SUBTEXT};
+        color: $SUBTEXT;
         font-weight: 600;
-    }}
-    QTabBar::tab:selected {{
+    }
+    QTabBar::tab:selected {
         background: #FFFFFF;
-        color: {_TEXT};
-    }}
+        color: $TEXT;
+    }
     /* Neutral tab hover */
-    QTabBar::tab:hover {{
-        background: {_HOVER_BG};
-        color: {_TEXT};
-    }}
-
-    /* ---- Lists / Trees / Text ---- */
-    QListWidget, QTreeWidget, QTextEdit, QPlainTextEdit {{
+    QTabBar::tab:hover {
+        background: $HOVER_BG;
+        color: $TEXT;
+    }
+    """),
+    "lists": string.Template("""
+    QListWidget, QTreeWidget, QTextEdit, QPlainTextEdit {
         background: #FFFFFF;
-        border: 1px solid {_BORDER};
+        border: 1px solid $BORDER;
         border-radius: 8px;
         padding: 8px;
-    }}
+    }
     /* Neutral row hover */
-    QListView::item:hover, QTreeView::item:hover, QTableView::item:hover {{
-        background: {_HOVER_BG};
-        color: {_TEXT};
-    }}
-
-    /* ---- Tables ---- */
-    QTableView {{
+    QListView::item:hover, QTreeView::item:hover, QTableView::item:hover {
+        background: $HOVER_BG;
+        color: $TEXT;
+    }
+    """),
+    "tables": string.Template("""
+    QTableView {
         background: #FFFFFF;
-        border: 1px solid {_BORDER};
+        border: 1px solid $BORDER;
         border-radius: 8px;
-        gridline-color: {_BORDER};
-        selection-background-color: {_ACCENT};
+        gridline-color: $BORDER;
+        selection-background-color: $ACCENT;
         selection-color: #FFFFFF;
-    }}
-    QHeaderView::section {{
+    }
+    QHeaderView::section {
         background: #F8FAFC;
-        color: {_SUBTEXT};
-        border: 1px solid {_BORDER};
+        color: $SUBTEXT;
+        border: 1px solid $BORDER;
         padding: 6px 8px;
         font-weight: 600;
-    }}
-
-    /* ---- Sliders ---- */
-    QSlider::groove:horizontal {{
-        height: 4px; background: {_BORDER}; border-radius: 2px;
-    }}
-    QSlider::handle:horizontal {{
+    }
+    """),
+    "sliders": string.Template("""
+    QSlider::groove:horizontal {
+        height: 4px; background: $BORDER; border-radius: 2px;
+    }
+    QSlider::handle:horizontal {
         width: 16px; height: 16px; margin: -6px 0;
-        border-radius: 8px; background: {_ACCENT};
-    }}
-    QSlider::handle:horizontal:hover {{ background: {_ACCENT}; }}  /* no color jump on hover */
-
-    /* ---- Checks / Radios ---- */
-    QCheckBox, QRadioButton {{ spacing: 8px; }}
-    QCheckBox::indicator, QRadioButton::indicator {{
-        width: 16px; height: 16px; border: 1px solid {_BORDER};
+        border-radius: 8px; background: $ACCENT;
+    }
+    QSlider::handle:horizontal:hover { background: $ACCENT; }  /* no color jump on hover */
+    """),
+    "checks": string.Template("""
+    QCheckBox, QRadioButton { spacing: 8px; }
+    QCheckBox::indicator, QRadioButton::indicator {
+        width: 16px; height: 16px; border: 1px solid $BORDER;
         border-radius: 3px; background: #FFFFFF;
-    }}
-    QRadioButton::indicator {{ border-radius: 8px; }}
-    QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-        border-color: {_ACCENT}; background: {_ACCENT};
-    }}
-
-    /* ---- Splitter ---- */
-    QSplitter::handle {{ background: {_BORDER}; width: 4px; height: 4px; border-radius: 2px; }}
-    QSplitter::handle:hover {{ background: {_HOVER_BG}; }}
-
-    /* ---- Scrollbars ---- */
-    QScrollBar:vertical {{ background: transparent; width: 10px; margin: 2px; }}
-    QScrollBar::handle:vertical {{ background: #CBD5E1; border-radius: 5px; min-height: 28px; }}
-    QScrollBar::handle:vertical:hover {{ background: #A7B4C6; }}
-    QScrollBar:horizontal {{ background: transparent; height: 10px; margin: 2px; }}
-    QScrollBar::handle:horizontal {{ background: #CBD5E1; border-radius: 5px; min-width: 28px; }}
-    QScrollBar::add-line, QScrollBar::sub-line {{ width: 0; height: 0; }}
-
-    /* ---- Menus ---- */
-    QMenu {{
+    }
+    QRadioButton::indicator { border-radius: 8px; }
+    QCheckBox::indicator:checked, QRadioButton::indicator:checked {
+        border-color: $ACCENT; background: $ACCENT;
+    }
+    """),
+    "splitter": string.Template("""
+    QSplitter::handle { background: $BORDER; width: 4px; height: 4px; border-radius: 2px; }
+    QSplitter::handle:hover { background: $HOVER_BG; }
+    """),
+    "scrollbars": string.Template("""
+    QScrollBar:vertical { background: transparent; width: 10px; margin: 2px; }
+    QScrollBar::handle:vertical { background: #CBD5E1; border-radius: 5px; min-height: 28px; }
+    QScrollBar::handle:vertical:hover { background: #A7B4C6; }
+    QScrollBar:horizontal { background: transparent; height: 10px; margin: 2px; }
+    QScrollBar::handle:horizontal { background: #CBD5E1; border-radius: 5px; min-width: 28px; }
+    QScrollBar::add-line, QScrollBar::sub-line { width: 0; height: 0; }
+    """),
+    "menus": string.Template("""
+    QMenu {
         background: #FFFFFF;
-        border: 1px solid {_BORDER};
+        border: 1px solid $BORDER;
         border-radius: 8px;
         padding: 6px 0;
-    }}
-    QMenu::item {{
+    }
+    QMenu::item {
         padding: 6px 12px;
         border-radius: 6px;
-        color: {_TEXT};
-    }}
+        color: $TEXT;
+    }
     /* Neutral hover/selection in menus */
-    QMenu::item:selected {{
-        background: {_HOVER_BG};
-        color: {_TEXT};
-    }}
-
-    /* ---- Tooltips / Status ---- */
-    QToolTip {{
-        background: {_TEXT};
+    QMenu::item:selected {
+        background: $HOVER_BG;
+        color: $TEXT;
+    }
+    """),
+    "status": string.Template("""
+    QToolTip {
+        background: $TEXT;
         color: #FFFFFF;
         border: 0;
         padding: 6px 8px;
         border-radius: 6px;
         opacity: 220;
-    }}
-    QStatusBar {{
-        background: {_PANEL};
-        border: 1px solid {_BORDER};
+    }
+    QStatusBar {
+        background: $PANEL;
+        border: 1px solid $BORDER;
         border-radius: 8px;
         padding: 4px 8px;
-    }}
-
-    /* ---- Progress ---- */
-    QProgressBar {{
-        border: 1px solid {_BORDER};
+    }
+    """),
+    "progress": string.Template("""
+    QProgressBar {
+        border: 1px solid $BORDER;
         border-radius: 8px;
         background: #FFFFFF;
         padding: 2px;
         text-align: center;
-    }}
-    QProgressBar::chunk {{
-        background-color: {_ACCENT};
+    }
+    QProgressBar::chunk {
+        background-color: $ACCENT;
         border-radius: 6px;
-    }}
+    }
+    """),
+}
+
+
+def _minify(qss: str) -> str:
+    """Drop comments and redundant whitespace (less for Qt's CSS tokenizer)."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", qss).strip()
+
+
+_LIGHT_HEX = {name: f"#{v:06X}" for name, v in _LIGHT.items()}
+
+
+@functools.lru_cache(maxsize=16)
+def build_qss(include: tuple | None = None) -> str:
+    """
+    Minified stylesheet made of the `include`d fragments (a tuple of
+    _QSS_FRAGMENTS keys); None builds the full sheet. Fragments are always
+    emitted in sheet order, whatever the order of `include`.
     """
-    app.setStyleSheet(qss)
+    if include is not None:
+        unknown = [n for n in include if n not in _QSS_FRAGMENTS]
+        if unknown:
+            raise ValueError(f"Unknown QSS fragment(s): {', '.join(unknown)}")
+    names = [n for n in _QSS_FRAGMENTS if include is None or n in include]
+    return "".join(_minify(_QSS_FRAGMENTS[n].substitute(_LIGHT_HEX)) for n in names)
+
+
+def _source_digest() -> str:
+    """Fingerprint of the palette and fragments the generated sheet came from."""
+    src = repr((sorted(_LIGHT.items()), [(k, t.template) for k, t in _QSS_FRAGMENTS.items()]))
+    return hashlib.sha1(src.encode("utf-8")).hexdigest()
+
+
+def _load_qss() -> str:
+    # Prefer the sheet pre-built into _theme_qss.py (run this file to refresh
+    # it); rebuild instead when it is missing or older than the templates.
+    try:
+        from ._theme_qss import QSS, SOURCE_DIGEST
+    except ImportError:
+        return build_qss()
+    return QSS if SOURCE_DIGEST == _source_digest() else build_qss()
+
+
+_QSS_CACHED = _load_qss()
+
+# Primary (accent) buttons carry their own small sheet instead of an
+# app-wide #objectName rule that every widget would be matched against
+_PRIMARY_BTN_QSS = _minify(string.Template("""
+    QPushButton { background: $ACCENT; border: 1px solid $ACCENT; color: #FFFFFF; }
+    QPushButton:hover { background: $ACCENT_D; border-color: $ACCENT_D; }
+    QPushButton:pressed { background: $ACCENT_D; }
+""").substitute(_LIGHT_HEX))
+
+
+def style_primary_button(btn) -> None:
+    """Give a QPushButton the accent (primary) look."""
+    btn.setStyleSheet(_PRIMARY_BTN_QSS)
+
+
+def get_qss_text() -> str:
+    """The built (minified) application stylesheet; needs no Qt import."""
+    return _QSS_CACHED
+
+
+def _apply_qss(app: QApplication) -> None:
+    # setStyleSheet re-polishes every widget even for an identical sheet;
+    # skip it when this exact sheet is already installed
+    h = hash(_QSS_CACHED)
+    if app.property("_qss_hash") == h and app.styleSheet():
+        return
+    app.setStyleSheet(_QSS_CACHED)
+    app.setProperty("_qss_hash", h)
+
+
+def apply_theme(app: QApplication) -> None:
+    """
+    Install the whole theme: Fusion style, palette, then the stylesheet.
+    The sheet goes last so the one re-polish it triggers sees the final
+    palette; do not interleave other palette writes with it.
+    """
+    _apply_palette(app)
+    _apply_qss(app)
+
+
+# Separate entry points kept for existing callers; prefer apply_theme()
+def apply_ultra_clean_theme(app: QApplication) -> None:
+    _apply_palette(app)
+
+
+def load_ultra_clean_qss(app: QApplication) -> None:
+    _apply_qss(app)
+
+
+def write_generated_qss(path: str | None = None) -> str:
+    """Write the full built sheet to _theme_qss.py (next to this file); returns the path."""
+    qss = build_qss()
+    if not qss.isascii():
+        raise ValueError("generated QSS must be ASCII")
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "_theme_qss.py")
+    rules = [r + "}" for r in qss.split("}") if r]
+    lines = [
+        "# _theme_qss.py",
+        "# Generated by `python theme.py` from the templates in theme.py; do not edit.",
+        "",
+        f'SOURCE_DIGEST = "{_source_digest()}"',
+        "",
+        "QSS = (",
+        *(f"    {r!r}" for r in rules),
+        ")",
+        "",
+    ]
+    with open(path, "w", encoding="ascii", newline="\n") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+if __name__ == "__main__":
+    print("wrote", write_generated_qss())
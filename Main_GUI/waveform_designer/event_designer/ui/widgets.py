@@ -3,38 +3,87 @@
 Custom widgets for the haptic waveform designer
 """
 
+import contextlib
+import functools
 import os
 import json
-from PyQt6.QtCore import Qt, pyqtSignal, QByteArray, QMimeData
-from PyQt6.QtGui import QDrag
+from PyQt6.QtCore import Qt, pyqtSignal, QByteArray, QMimeData, QTimer, QFileSystemWatcher
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem,
-    QToolButton, QSizePolicy, QFrame, QMenu, QMessageBox,
+    QToolButton, QSizePolicy, QFrame,
 )
-from PyQt6.QtWidgets import QApplication
+
+# Optional orjson (faster drag payload (de)serialisation, bytes in/out)
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+# Optional msgpack (binary drag payload next to the JSON one)
+try:
+    import msgpack as _msgpack
+except Exception:
+    _msgpack = None
 
 # Import from event data model and waveform editor widget
 try:
-    from ..core import HapticEvent, EventCategory, WaveformData, MIME_WAVEFORM
+    from ..core import (
+        HapticEvent, EventCategory, WaveformData, MIME_WAVEFORM, MIME_WAVEFORM_MP, event_sidecar_paths,
+    )
 except ImportError:
-    from core.event_data_model import HapticEvent, EventCategory, WaveformData
+    from core.event_data_model import HapticEvent, EventCategory, WaveformData, event_sidecar_paths
     MIME_WAVEFORM = "application/x-waveform"
+    MIME_WAVEFORM_MP = "application/x-waveform-msgpack"
 
-try:
-    from ...waveform_widget.waveform_editor_widget import WaveformEditorWidget
-except ImportError:
+
+@functools.lru_cache(maxsize=1)
+def _waveform_editor_class():
+    """WaveformEditorWidget, imported on first EditorDropProxy construction."""
     try:
-        from waveform_widget.waveform_editor_widget import WaveformEditorWidget
+        from ...waveform_widget.waveform_editor_widget import WaveformEditorWidget
     except ImportError:
-        # Fallback: create a dummy widget to prevent crashes
-        from PyQt6.QtWidgets import QLabel
-        class WaveformEditorWidget(QLabel):
-            def __init__(self, parent=None):
-                super().__init__("WaveformEditorWidget not available", parent)
-            def set_event(self, event): pass
+        try:
+            from waveform_widget.waveform_editor_widget import WaveformEditorWidget
+        except ImportError:
+            # Fallback: create a dummy widget to prevent crashes
+            class WaveformEditorWidget(QLabel):
+                def __init__(self, parent=None):
+                    super().__init__("WaveformEditorWidget not available", parent)
+                def set_event(self, event): pass
+    return WaveformEditorWidget
+
+def _dump_payload(payload) -> bytes:
+    """Library drag payload -> compact UTF-8 JSON bytes."""
+    if _orjson is not None:
+        return _orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Item role holding a pre-serialized JSON payload (QByteArray) for fixed rows
+_PAYLOAD_BYTES_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _load_payload(raw: bytes):
+    """Inverse of _dump_payload()."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CollapsibleSection(QWidget):
     """Header + content container. Can be collapsible or forced always-open."""
+
+    # Header button sheet, shared by every section
+    _BTN_QSS = """
+        QToolButton {
+            border: none;
+            font-weight: 700;
+            color: #2D3748;
+            padding: 6px 4px;
+            text-align: left;
+        }
+        QToolButton:hover { color: #1A202C; }
+    """
     
     def __init__(self, title: str, content_widget: QWidget, *,
                  collapsed: bool = False, always_expanded: bool = False,
@@ -51,16 +100,7 @@ class CollapsibleSection(QWidget):
         self.toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.toggle_btn.setArrowType(Qt.ArrowType.DownArrow)
         self.toggle_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.toggle_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                font-weight: 700;
-                color: #2D3748;
-                padding: 6px 4px;
-                text-align: left;
-            }
-            QToolButton:hover { color: #1A202C; }
-        """)
+        self.toggle_btn.setStyleSheet(self._BTN_QSS)
 
         # Content container
         self.content_area = QFrame(self)
@@ -107,24 +147,32 @@ class LibraryTree(QTreeWidget):
         self.setDragEnabled(True)
         self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
         self.setDefaultDropAction(Qt.DropAction.CopyAction)
+        # All rows are one text line: lets the view skip per-row size queries
+        self.setUniformRowHeights(True)
         # Slightly larger target for better UX
         self.setIconSize(self.iconSize())
 
     def _payload_for_item(self, item: QTreeWidgetItem) -> dict | None:
         """Return normalized payload dict for an item."""
         data = item.data(0, Qt.ItemDataRole.UserRole)
+        # Rows built by EventLibraryWidget are stored already normalized
+        if isinstance(data, dict) and "v" in data and "kind" in data:
+            return data
         if not data:
             return None
-        # Normalize minimal schema
+        # Normalize minimal schema (items inserted by other code)
         if isinstance(data, dict):
-            # Add version + type if missing
-            data.setdefault("v", 1)
-            if "kind" not in data:
+            # Add version + type if missing, on a copy stored back on the item
+            # (so later drags take the fast path above)
+            out = dict(data)
+            out.setdefault("v", 1)
+            if "kind" not in out:
                 # Heuristic: builtin oscillators tagged via "osc_name"
-                if "osc_name" in data:
-                    data["kind"] = "osc"
-                    data["name"] = data.pop("osc_name")
-            return data
+                if "osc_name" in out:
+                    out["kind"] = "osc"
+                    out["name"] = out.pop("osc_name")
+            item.setData(0, Qt.ItemDataRole.UserRole, out)
+            return out
         if isinstance(data, str):
             # Back-compat: strings like "oscillator::Sine" or file path
             if data.startswith("oscillator::"):
@@ -136,47 +184,74 @@ class LibraryTree(QTreeWidget):
         item = self.currentItem()
         if not item:
             return
-        payload = self._payload_for_item(item)
-        if not payload:
-            return
+        cached = item.data(0, _PAYLOAD_BYTES_ROLE)
+        payload = None
+        if cached is None or _msgpack is not None:
+            payload = self._payload_for_item(item)
+            if not payload:
+                return
 
         md = QMimeData()
-        md.setData(MIME_WAVEFORM, QByteArray(json.dumps(payload).encode("utf-8")))
+        # JSON stays the canonical format (the editor widget reads it)
+        md.setData(MIME_WAVEFORM, cached if cached is not None else _dump_payload(payload))
+        if _msgpack is not None:
+            md.setData(MIME_WAVEFORM_MP, _msgpack.packb(payload, use_bin_type=True))
+        from PyQt6.QtGui import QDrag
         drag = QDrag(self)
         drag.setMimeData(md)
         drag.exec(Qt.DropAction.CopyAction, Qt.DropAction.CopyAction)
 
 
+@functools.lru_cache(maxsize=1)
+def _resolve_library_paths() -> tuple[str, str, str]:
+    """
+    (lib_root, custom_dir, import_dir) for this install. Resolved, checked and
+    created once per process; later EventLibraryManager instances reuse it.
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    main_gui = os.path.dirname(current_dir)
+    project_root = os.path.dirname(main_gui)
+
+    # Verify it's the project root (one directory read instead of a stat per name)
+    indicators = ['requirements.txt', 'pyproject.toml', '.git', 'README.md']
+    try:
+        with os.scandir(project_root) as it:
+            present = {e.name for e in it}
+    except OSError:
+        present = set()
+    if present.isdisjoint(indicators):
+        print(f"Warning: Project root indicators not found in {project_root}")
+
+    lib_root = os.path.join(project_root, "waveform_library")
+    custom_dir = os.path.join(lib_root, "customized")
+    import_dir = os.path.join(lib_root, "imported")
+
+    # Create directories if they don't exist
+    for d in (lib_root, custom_dir, import_dir):
+        os.makedirs(d, exist_ok=True)
+
+    # Create __init__.py if it doesn't exist ("x": the open itself is the check)
+    try:
+        with open(os.path.join(lib_root, "__init__.py"), "x", encoding="utf-8") as f:
+            f.write("# Waveform Library\n")
+    except FileExistsError:
+        pass
+    return lib_root, custom_dir, import_dir
+
+
 class EventLibraryManager:
     """Manages file paths and directories for the waveform library."""
+
+    __slots__ = ("lib_root", "custom_dir", "import_dir", "_scan_cache")
     
     def __init__(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        main_gui = os.path.dirname(current_dir)
-        project_root = os.path.dirname(main_gui)
-        
-        # Verify it's the project root
-        indicators = ['requirements.txt', 'pyproject.toml', '.git', 'README.md']
-        if not any(os.path.exists(os.path.join(project_root, i)) for i in indicators):
-            print(f"Warning: Project root indicators not found in {project_root}")
-        
-        self.lib_root = os.path.join(project_root, "waveform_library")
-        self.custom_dir = os.path.join(self.lib_root, "customized")
-        self.import_dir = os.path.join(self.lib_root, "imported")
-        
-        # Create directories if they don't exist
-        for d in (self.lib_root, self.custom_dir, self.import_dir):
-            os.makedirs(d, exist_ok=True)
+        self.lib_root, self.custom_dir, self.import_dir = _resolve_library_paths()
+        # dir -> (st_mtime_ns, sorted (name, path) pairs), see list_bucket()
+        self._scan_cache: dict[str, tuple[int, tuple[tuple[str, str], ...]]] = {}
         
         print(f"Library root   : {self.lib_root}")
         print(f"Customized dir : {self.custom_dir}")
         print(f"Imported dir   : {self.import_dir}")
-        
-        # Create __init__.py if it doesn't exist
-        init_file = os.path.join(self.lib_root, "__init__.py")
-        if not os.path.exists(init_file):
-            with open(init_file, "w", encoding="utf-8") as f:
-                f.write("# Waveform Library\n")
 
     def get_events_directory(self, bucket: str = "customized"):
         """Get the directory path for the specified bucket."""
@@ -186,11 +261,33 @@ class EventLibraryManager:
             return self.lib_root
         return self.custom_dir
 
+    def list_bucket(self, bucket: str = "customized") -> tuple[tuple[str, str], ...]:
+        """
+        Sorted (name, path) pairs of the .json/.csv files in a bucket
+        (directories with those suffixes are skipped). The listing is kept
+        per directory and only re-read when the directory's mtime changes.
+        """
+        path = self.get_events_directory(bucket)
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._scan_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        # Suffix test first; is_file() uses the d_type scandir already read
+        with os.scandir(path) as it:
+            entries = [(e.name, e.path) for e in it
+                       if e.name.endswith((".json", ".csv")) and e.is_file()]
+        entries.sort()
+        entries = tuple(entries)
+        self._scan_cache[path] = (mtime, entries)
+        return entries
+
 class EventLibraryWidget(QWidget):
     """Waveform Library with 3 sections; emits payload on double-click."""
     
     event_selected = pyqtSignal(object)
     BUILTIN_OSC = ["Sine", "Square", "Saw", "Triangle", "Chirp", "FM", "PWM", "Noise"]
+    # File rows are created this many at a time; the rest follow on idle
+    FILE_BATCH = 256
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -215,32 +312,75 @@ class EventLibraryWidget(QWidget):
         self.tree.itemDoubleClicked.connect(self._on_double_clicked)
         v.addWidget(self.tree)
 
+        # Section roots live for the widget's lifetime; the oscillator rows never
+        # change, so refresh() only rebuilds the customized subtree
+        self._osc_root = QTreeWidgetItem(["Oscillators"])
+        osc_children = [QTreeWidgetItem([name]) for name in self.BUILTIN_OSC]
+        for child, name in zip(osc_children, self.BUILTIN_OSC):
+            child.setData(0, Qt.ItemDataRole.UserRole, {"v": 1, "kind": "osc", "name": name})
+            child.setData(0, _PAYLOAD_BYTES_ROLE, _OSC_PAYLOAD_BYTES[name])
+        self._osc_root.addChildren(osc_children)
+        self._cust_root = QTreeWidgetItem(["Customized Signals"])
+        self.tree.addTopLevelItems([self._osc_root, self._cust_root])
+
+        # Large folders: rows beyond the first batch are added from the event loop
+        self._pending_files: list[tuple[str, str]] = []
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.setSingleShot(True)
+        self._fetch_timer.setInterval(0)
+        self._fetch_timer.timeout.connect(self._fetch_more_files)
+
+        # Pick up files added/removed outside the app; bursts (a copy of many
+        # files) collapse into one refresh 100 ms after the last change
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._watcher = QFileSystemWatcher([self.custom_dir], self)
+        self._watcher.directoryChanged.connect(self._refresh_timer.start)
         
         self.refresh()
+        # The roots persist, so expanding once is enough; posted so that it runs
+        # after the first show instead of laying out a not-yet-visible tree
+        QTimer.singleShot(0, self.tree.expandAll)
     
+    @contextlib.contextmanager
+    def _batched_update(self):
+        """Hold repaints, sorting and item signals while rows are inserted."""
+        tree = self.tree
+        updates = tree.updatesEnabled()   # restore, not force: calls may nest
+        tree.setUpdatesEnabled(False)
+        sorting = tree.isSortingEnabled()
+        tree.setSortingEnabled(False)
+        blocked = tree.blockSignals(True)
+        try:
+            yield tree
+        finally:
+            tree.blockSignals(blocked)
+            tree.setSortingEnabled(sorting)
+            tree.setUpdatesEnabled(updates)
+
     def refresh(self):
         """Refresh the library tree contents."""
-        self.tree.clear()
-        
-        # Oscillators section
-        osc_root = QTreeWidgetItem(["Oscillators"])
-        self.tree.addTopLevelItem(osc_root)
-        for name in self.BUILTIN_OSC:
-            child = QTreeWidgetItem([name])
-            child.setData(0, Qt.ItemDataRole.UserRole, {"kind": "osc", "name": name})
-            osc_root.addChild(child)
-        
-        # Customized signals section
-        cust_root = QTreeWidgetItem(["Customized Signals"])
-        self.tree.addTopLevelItem(cust_root)
-        for fn in sorted(os.listdir(self.custom_dir)):
-            if fn.endswith((".json", ".csv")):
-                p = os.path.join(self.custom_dir, fn)
-                child = QTreeWidgetItem([os.path.splitext(fn)[0]])
-                child.setData(0, Qt.ItemDataRole.UserRole, {"kind": "file", "path": p})
-                cust_root.addChild(child)
-        
-        self.tree.expandAll()
+        with self._batched_update() as tree:
+            # Customized signals section (oscillator rows are kept as built)
+            self._cust_root.takeChildren()
+            self._pending_files = list(self.manager.list_bucket("customized"))
+            self._fetch_more_files()
+
+    def _fetch_more_files(self):
+        """Add the next batch of file rows; re-arms itself until none are left."""
+        batch = self._pending_files[:self.FILE_BATCH]
+        del self._pending_files[:self.FILE_BATCH]
+        children = []
+        for name, path in batch:
+            child = QTreeWidgetItem([name[:name.rfind(".")]])
+            child.setData(0, Qt.ItemDataRole.UserRole, {"v": 1, "kind": "file", "path": path})
+            children.append(child)
+        with self._batched_update():
+            self._cust_root.addChildren(children)
+        if self._pending_files:
+            self._fetch_timer.start()
     
     def _on_double_clicked(self, item, _col):
         """Handle double-click on tree item."""
@@ -258,53 +398,92 @@ class EventLibraryWidget(QWidget):
         if not payload or payload.get("kind") != "file": 
             return
         
+        from PyQt6.QtWidgets import QMenu, QMessageBox
         menu = QMenu(self)
         act_del = menu.addAction("Delete")
         act = menu.exec(self.tree.viewport().mapToGlobal(pos))
         
         if act == act_del:
             try:
+                for side in event_sidecar_paths(payload["path"]):
+                    os.remove(side)
                 os.remove(payload["path"])
                 self.refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Delete failed", str(e))
 
+
+# Builtin oscillator payloads never change: serialize them once
+_OSC_PAYLOAD_BYTES = {
+    name: QByteArray(_dump_payload({"v": 1, "kind": "osc", "name": name}))
+    for name in EventLibraryWidget.BUILTIN_OSC
+}
+
+
 class EditorDropProxy(QWidget):
     """Proxy widget that wraps the waveform editor and handles drag/drop."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
-        self.editor = WaveformEditorWidget(self)
+        self.editor = _waveform_editor_class()(self)
         self.editor.setAcceptDrops(False)
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
         lay.addWidget(self.editor)
         self._current_event: HapticEvent | None = None
+        # Payload format picked on drag enter; reused by move/drop events
+        self._drag_fmt: str | None = None
 
     def set_event(self, evt: HapticEvent) -> None:
         self._current_event = evt
         self.editor.set_event(evt)
 
+    @staticmethod
+    def _pick_format(md) -> str | None:
+        """Preferred payload format offered by `md` (one formats() read), or None."""
+        fmts = md.formats()
+        if _msgpack is not None and MIME_WAVEFORM_MP in fmts:
+            return MIME_WAVEFORM_MP
+        if MIME_WAVEFORM in fmts:
+            return MIME_WAVEFORM
+        return None
+
     def dragEnterEvent(self, e):
-        if e.mimeData().hasFormat(MIME_WAVEFORM):
+        self._drag_fmt = self._pick_format(e.mimeData())
+        if self._drag_fmt is not None:
             e.acceptProposedAction()
         else:
             e.ignore()
 
-    def dropEvent(self, e):
-        if not e.mimeData().hasFormat(MIME_WAVEFORM):
+    def dragMoveEvent(self, e):
+        # Fires on every hover move: reuse the enter-time decision
+        if self._drag_fmt is not None:
+            e.acceptProposedAction()
+        else:
             e.ignore()
-            return
 
+    def dragLeaveEvent(self, e):
+        self._drag_fmt = None
+        super().dragLeaveEvent(e)
+
+    def dropEvent(self, e):
+        md = e.mimeData()
+        fmt = self._drag_fmt or self._pick_format(md)
+        self._drag_fmt = None
         try:
-            raw = bytes(e.mimeData().data(MIME_WAVEFORM)).decode("utf-8")
-            payload = json.loads(raw)
+            if fmt == MIME_WAVEFORM_MP:
+                payload = _msgpack.unpackb(md.data(fmt).data(), raw=False)
+            elif fmt == MIME_WAVEFORM:
+                payload = _load_payload(md.data(fmt).data())
+            else:
+                e.ignore()
+                return
         except Exception:
             e.ignore()
             return
 
-        # Modif. clavier (PyQt6: passer par QApplication)
-        mods = QApplication.keyboardModifiers()
+        # Modif. clavier (portés par l'événement de drop)
+        mods = e.modifiers()
         # ✅ Par défaut on REPLACE pour que la forme corresponde au signal choisi
         drop_mod = (
             "add"       if (mods & Qt.KeyboardModifier.ShiftModifier) else
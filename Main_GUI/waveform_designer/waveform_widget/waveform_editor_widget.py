@@ -338,12 +338,12 @@ class WaveformEditorWidget(QWidget):
 
         # ---- Y range (amplitude, left axis) ----
         y = None
-        if wf.amplitude:
+        if wf.amp_samples().size:
             amp_mod = self.current_event.get_modified_waveform()
             if amp_mod is not None:
                 y = np.asarray(amp_mod, float)
             else:
-                y = np.asarray([pt["amplitude"] for pt in wf.amplitude], float)
+                y = wf.amp_samples()
 
         if y is None or y.size == 0:
             ymin, ymax = -1.0, 1.0
@@ -727,8 +727,9 @@ class WaveformEditorWidget(QWidget):
         try:
             # Duty = RMS de la waveform (jamais 0 si signal ≠ 0)
             wf = self.current_event.waveform_data
-            amps = [p["amplitude"] for p in getattr(wf, "amplitude", [])] or [0.5]
-            a = np.asarray(amps, dtype=float)
+            a = wf.amp_samples() if wf is not None else np.empty(0)
+            if a.size == 0:
+                a = np.array([0.5])
             rms = float(np.sqrt(np.mean(np.square(a))))
             rms = float(np.clip(rms, 0.0, 1.0))
             duty = int(max(1, min(15, round(rms * 15.0))))
@@ -800,22 +801,20 @@ class WaveformEditorWidget(QWidget):
         y = np.asarray(y, float); t = np.asarray(t, float); sr = float(sr)
         wf = self.current_event.waveform_data
 
-        if wf and wf.amplitude:
-            y1 = np.array([p["amplitude"] for p in wf.amplitude], dtype=float)
+        if wf and wf.amp_samples().size:
+            y1 = wf.amp_samples().copy()
             sr1 = float(wf.sample_rate)
             y2 = resample_to(y, sr, sr1)
             n = min(y1.size, y2.size)
             if n == 0:
                 return
             y1[:n] *= y2[:n]
-            t1 = np.arange(y1.size, dtype=float) / sr1
-            wf.amplitude = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t1, y1)]
+            wf.set_amplitude_arrays(None, y1)   # uniform grid at sr1
             wf.duration = float(y1.size / sr1)
         else:
             duration = float(t[-1] - t[0]) if t.size > 1 else (y.size / sr if sr > 0 else 0.0)
-            amp_pts = [{"time": float(tt), "amplitude": float(yy)} for tt, yy in zip(t, y)]
             freq_pts = [{"time": 0.0, "frequency": 0.0}, {"time": duration, "frequency": 0.0}]
-            self.current_event.waveform_data = WaveformData(amp_pts, freq_pts, duration, sr)
+            self.current_event.waveform_data = WaveformData((t, y), freq_pts, duration, sr)
 
         self.plot_event(self.current_event)
 
@@ -847,9 +846,9 @@ class WaveformEditorWidget(QWidget):
             else:
                 obj = json.load(open(path, "r", encoding="utf-8"))
                 if "waveform_data" in obj:
-                    wf = obj["waveform_data"]
-                    y = np.asarray([p["amplitude"] for p in wf["amplitude"]], dtype=float)
-                    sr = float(wf.get("sample_rate", 1000.0))
+                    wf = WaveformData.from_dict(obj["waveform_data"], os.path.dirname(os.path.abspath(path)))
+                    y = wf.amp_samples()
+                    sr = float(wf.sample_rate)
                     t = np.arange(y.size, dtype=float) / sr if y.size else np.zeros(0, dtype=float)
                 else:
                     y = np.asarray(obj["amplitude"], dtype=float)
@@ -877,14 +876,13 @@ class WaveformEditorWidget(QWidget):
             QMessageBox.information(self, "Save CSV", "Nothing to save.")
             return
         wf = self.current_event.waveform_data
-        if not wf.amplitude:
+        t, y = wf.amp_arrays()
+        if not y.size:
             QMessageBox.information(self, "Save CSV", "Amplitude is empty.")
             return
         path, _ = QFileDialog.getSaveFileName(self, "Save Signal as CSV", "signal.csv", "CSV (*.csv)")
         if not path:
             return
-        t = np.array([p["time"] for p in wf.amplitude], dtype=float)
-        y = np.array([p["amplitude"] for p in wf.amplitude], dtype=float)
         try:
             np.savetxt(path, np.column_stack([t, y]), delimiter=",", header="t,amplitude", comments="")
         except Exception as e:
@@ -941,10 +939,8 @@ class WaveformEditorWidget(QWidget):
         name = getattr(event.metadata, "name", "")
 
         # ---------- Amplitude ----------
-        if wf.amplitude:
-            t_a  = np.asarray([pt["time"] for pt in wf.amplitude], dtype=float)
-            a    = np.asarray([pt["amplitude"] for pt in wf.amplitude], dtype=float)
-
+        t_a, a = wf.amp_arrays()
+        if a.size:
             t_disp, a_disp = create_faithful_display_signal(t_a, a, target_points=2000, signal_name=name)
             self._set_curve_data(self.curve_amp_org, t_disp, a_disp)
 
@@ -1008,7 +1004,7 @@ class WaveformEditorWidget(QWidget):
     # ---- Editable callbacks -----------------------------------------------
     def _amp_moved(self, x: np.ndarray, y: np.ndarray):
         if not self.current_event: return
-        self.current_event.waveform_data.amplitude = [{"time": float(tx), "amplitude": float(ay)} for tx, ay in zip(x, y)]
+        self.current_event.waveform_data.set_amplitude_arrays(x, y)
         self.plot_event(self.current_event)
 
     def _freq_moved(self, x: np.ndarray, y: np.ndarray):
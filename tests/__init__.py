@@ -0,0 +1,15 @@
+# tests/__init__.py
+"""
+Unit tests for the waveform designer core (stdlib unittest, no Qt needed).
+
+Run from the repository root:
+    python -m unittest discover -s tests -t .
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _p in (os.path.join(_ROOT, "Main_GUI"), os.path.join(_ROOT, "Main_GUI", "waveform_designer")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
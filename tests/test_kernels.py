@@ -0,0 +1,130 @@
+# test_kernels.py
+"""Numeric kernels: the Numba and NumPy/pure-Python paths against references."""
+
+import unittest
+
+import numpy as np
+
+from event_designer.core import kernels
+
+
+def _interp_impls():
+    """(name, fn) for every interp_sorted implementation usable here."""
+    impls = [("loop", kernels._interp_sorted_loop)]
+    if kernels._interp_sorted_jit is not None:
+        impls.append(("jit", kernels._interp_sorted_jit))
+    return impls
+
+
+class InterpSortedTests(unittest.TestCase):
+    def check(self, tg, t, y):
+        tg, t, y = (np.asarray(a, dtype=np.float64) for a in (tg, t, y))
+        ref = np.interp(tg, t, y)
+        np.testing.assert_allclose(kernels.interp_sorted(tg, t, y), ref, rtol=0, atol=1e-12)
+        for name, fn in _interp_impls():
+            with self.subTest(impl=name):
+                np.testing.assert_allclose(fn(tg, t, y), ref, rtol=0, atol=1e-12)
+
+    def test_random_grids(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            t = np.sort(rng.uniform(0.0, 1.0, 50))
+            y = rng.normal(size=50)
+            tg = np.sort(rng.uniform(-0.2, 1.2, 300))
+            self.check(tg, t, y)
+
+    def test_duplicate_time_stamps(self):
+        self.check([0.25, 0.5, 0.75], [0.0, 0.5, 0.5, 1.0], [0.0, 1.0, 2.0, 3.0])
+        # repeats at both ends, queries exactly on them and outside
+        self.check([-1.0, 0.0, 0.3, 1.0, 2.0], [0.0, 0.0, 0.5, 1.0, 1.0], [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.check(np.linspace(0.0, 1.0, 41), [0.0, 0.2, 0.2, 0.2, 0.6, 0.6, 1.0],
+                   [0.0, 1.0, -1.0, 0.5, 0.25, 0.75, 0.0])
+
+    def test_target_on_sample_times(self):
+        t = np.linspace(0.0, 1.0, 11)
+        self.check(t, t, np.arange(11.0) ** 2)
+
+
+def _duty_impls():
+    """(name, fn) for every prepare_duty implementation usable here."""
+    impls = [("numpy", kernels._prepare_duty_numpy), ("loop", kernels._prepare_duty_loop)]
+    if kernels._prepare_duty_jit is not None:
+        impls.append(("jit", kernels._prepare_duty_jit))
+    return impls
+
+
+class PrepareDutyTests(unittest.TestCase):
+    def check_parity(self, y, step):
+        y = np.asarray(y, dtype=np.float64)
+        m = -(-y.size // step)
+        results = {}
+        for name, fn in _duty_impls():
+            out = np.full(m + 3, 99, dtype=np.uint8)
+            # the NumPy path may work in place: give each implementation a copy
+            results[name] = fn(y.copy(), step, out).copy()
+            self.assertEqual(results[name].dtype, np.uint8)
+            self.assertEqual(results[name].size, m)
+            self.assertTrue((out[m:] == 99).all(), name)
+        ref = results.pop("numpy")
+        for name, got in results.items():
+            with self.subTest(impl=name, step=step):
+                np.testing.assert_array_equal(got, ref)
+        return ref
+
+    def test_random_signals(self):
+        rng = np.random.default_rng(1)
+        for step in (1, 2, 7, 50, 5000):
+            self.check_parity(rng.normal(size=1999), step)
+
+    def test_non_finite_samples_read_as_zero(self):
+        y = np.array([0.0, np.nan, 1.0, np.inf, -1.0, -np.inf, 0.5, 0.25])
+        for step in (1, 3):
+            codes = self.check_parity(y, step)
+            clean = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
+            np.testing.assert_array_equal(codes, self.check_parity(clean, step))
+
+    def test_constant_and_small_signals(self):
+        np.testing.assert_array_equal(self.check_parity(np.zeros(10), 3), 0)
+        np.testing.assert_array_equal(self.check_parity(np.full(10, 0.3), 3), 15)
+        codes = self.check_parity([0.0, 1e-3, 1.0], 1)
+        self.assertEqual(codes.tolist(), [0, 1, 15])   # non-zero never rounds to 0
+
+    def test_public_wrapper(self):
+        y = np.sin(np.linspace(0.0, 6.0, 1000))
+        np.testing.assert_array_equal(kernels.prepare_duty(y.copy(), 10),
+                                      kernels._prepare_duty_numpy(y.copy(), 10, np.empty(100, np.uint8)))
+        self.assertEqual(kernels.prepare_duty(np.empty(0), 4).size, 0)
+        with self.assertRaises(ValueError):
+            kernels.prepare_duty(y, 10, out=np.empty(5, dtype=np.uint8))
+
+
+class ComposeTests(unittest.TestCase):
+    @staticmethod
+    def reference(y1, y2, mode):
+        n = min(y1.size, y2.size)
+        out = y1[:n] + y2[:n] if mode == "add" else y1[:n] * y2[:n]
+        peak = np.abs(out).max() if n else 0.0
+        return out / peak if peak > 1.0 else out
+
+    def test_matches_reference(self):
+        rng = np.random.default_rng(2)
+        y1, y2 = rng.uniform(-1, 1, 500), rng.uniform(-1, 1, 420)
+        for mode in ("add", "multiply"):
+            with self.subTest(mode=mode):
+                np.testing.assert_allclose(kernels.compose(y1, y2, mode), self.reference(y1, y2, mode),
+                                           rtol=1e-12, atol=0)
+                if kernels._compose_jit is not None:
+                    out = np.empty(420)
+                    kernels._compose_loop(y1, y2, out, mode != "add")
+                    loop_out = np.empty(420)
+                    kernels._compose_jit(y1, y2, loop_out, mode != "add")
+                    np.testing.assert_array_equal(out, loop_out)
+
+    def test_quiet_result_is_not_normalized(self):
+        y = np.full(4, 0.25)
+        np.testing.assert_array_equal(kernels.compose(y, y, "add"), np.full(4, 0.5))
+        self.assertEqual(kernels.compose(y, np.empty(0), "add").size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# test_metadata.py
+"""EventMetadata tag handling."""
+
+import dataclasses
+import unittest
+
+from event_designer.core import EventCategory, EventMetadata
+
+
+def _meta(tags):
+    return EventMetadata(name="m", category=EventCategory.CUSTOM, tags=tags)
+
+
+class TagTests(unittest.TestCase):
+    def test_loading_keeps_user_tags_as_stored(self):
+        md = _meta(["b", "a", "b"])
+        self.assertEqual(md.tags, ["b", "a", "b"])
+
+    def test_category_tag_is_migrated(self):
+        md = _meta(["x", "category_name=Bumps", "y", "category_name=Other"])
+        self.assertEqual(md.category_name, "Bumps")
+        self.assertEqual(md.tags, ["x", "y"])
+
+    def test_add_tag_skips_present_tags(self):
+        md = _meta(["a"])
+        md.add_tag("b")
+        md.add_tag("a")
+        md.add_tag("b")
+        self.assertEqual(md.tags, ["a", "b"])
+
+    def test_add_tag_sees_direct_list_edits(self):
+        md = _meta([])
+        md.add_tag("a")
+        md.tags.append("c")
+        md.add_tag("c")
+        self.assertEqual(md.tags, ["a", "c"])
+        md.tags = ["z"]
+        md.add_tag("a")
+        self.assertEqual(md.tags, ["z", "a"])
+
+    def test_index_stays_out_of_asdict(self):
+        md = _meta([])
+        md.add_tag("a")
+        self.assertNotIn("_tag_set", dataclasses.asdict(md))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# test_persistence.py
+"""HapticEvent save/load: JSON document plus .npy amplitude sidecars."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from event_designer.core import HapticEvent, WaveformData, event_sidecar_paths
+from event_designer.core import event_data_model as edm
+
+
+class PersistenceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def path(self, name="evt.json"):
+        return os.path.join(self.dir, name)
+
+
+class OscillatorSaveTests(PersistenceTestCase):
+    def test_basic_oscillator_uses_implicit_grid(self):
+        evt = HapticEvent.new_basic_oscillator("Sine", frequency=50.0, duration=0.2, sample_rate=1000.0)
+        self.assertTrue(evt.waveform_data._amp_implicit_t)
+        p = self.path()
+        self.assertTrue(evt.save_to_file(p))
+        self.assertEqual(sorted(os.listdir(self.dir)), ["evt.amp.npy", "evt.json"])
+
+        back = HapticEvent.load_from_file(p)
+        t, y = back.waveform_data.amp_arrays()
+        np.testing.assert_allclose(t, np.arange(200) / 1000.0)
+        np.testing.assert_array_equal(y, evt.waveform_data.amp_samples())
+
+
+class SidecarTests(PersistenceTestCase):
+    def _event(self, t, y, sr=1000.0):
+        evt = HapticEvent(name="side")
+        evt.waveform_data = WaveformData((t, y), [{"time": 0.0, "frequency": 0.0}], 1.0, sr)
+        return evt
+
+    def test_explicit_time_grid_round_trip(self):
+        t = np.array([0.0, 0.1, 0.35, 0.9])
+        y = np.array([0.0, 1.0, -0.5, 0.25])
+        p = self.path()
+        self.assertTrue(self._event(t, y).save_to_file(p))
+        self.assertEqual(sorted(os.path.basename(q) for q in event_sidecar_paths(p)),
+                         ["evt.amp.npy", "evt.amp_t.npy"])
+        with open(p, encoding="utf-8") as f:
+            amp = json.load(f)["waveform_data"]["amplitude"]
+        self.assertEqual(amp, {"y_file": "evt.amp.npy", "t_file": "evt.amp_t.npy"})
+
+        back = HapticEvent.load_from_file(p).waveform_data
+        bt, by = back.amp_arrays()
+        self.assertEqual((bt.dtype, by.dtype), (np.float64, np.float32))
+        np.testing.assert_array_equal(bt, t)
+        np.testing.assert_array_equal(by, y.astype(np.float32))
+        self.assertFalse(back._amp_implicit_t)
+
+    def test_resave_on_uniform_grid_drops_stale_time_sidecar(self):
+        p = self.path()
+        self._event(np.array([0.0, 0.3]), np.array([1.0, 0.0])).save_to_file(p)
+        self._event(None, np.array([1.0, 0.5, 0.0])).save_to_file(p)
+        self.assertEqual([os.path.basename(q) for q in event_sidecar_paths(p)], ["evt.amp.npy"])
+        back = HapticEvent.load_from_file(p).waveform_data
+        self.assertTrue(back._amp_implicit_t)
+        np.testing.assert_allclose(back.amp_arrays()[0], [0.0, 0.001, 0.002])
+
+    def test_inline_and_legacy_point_layouts_load(self):
+        base = {"frequency": [], "duration": 0.002, "sample_rate": 1000.0}
+        cols = WaveformData.from_dict({**base, "amplitude": {"t": [0.0, 0.002], "y": [0.5, 1.0]}})
+        np.testing.assert_array_equal(cols.amp_arrays()[0], [0.0, 0.002])
+        pts = WaveformData.from_dict({**base, "amplitude": [{"time": 0.0, "amplitude": 0.5},
+                                                          {"time": 0.002, "amplitude": 1.0}]})
+        np.testing.assert_array_equal(pts.amp_samples(), cols.amp_samples())
+
+
+class JsonBackendTests(PersistenceTestCase):
+    """orjson and the stdlib fallback must write and read the same documents."""
+
+    def _backends(self):
+        yield "stdlib", mock.patch.object(edm, "_orjson", None)
+        if edm._orjson is not None:
+            yield "orjson", mock.patch.object(edm, "_orjson", edm._orjson)
+
+    def _event(self):
+        evt = HapticEvent.new_basic_oscillator("Saw", duration=0.05, sample_rate=1000.0)
+        evt.parameter_modifications.intensity_multiplier = float("nan")
+        evt.parameter_modifications.frequency_shift = float("inf")
+        evt.metadata.add_tag("nan-check")
+        return evt
+
+    def test_non_finite_values_are_written_as_null(self):
+        docs = {}
+        for name, patch in self._backends():
+            with self.subTest(backend=name), patch:
+                p = self.path(f"{name}.json")
+                self.assertTrue(self._event().save_to_file(p))
+                with open(p, "rb") as f:
+                    raw = f.read()
+                self.assertNotIn(b"NaN", raw)
+                self.assertNotIn(b"Infinity", raw)
+                doc = json.loads(raw)
+                pm = doc["parameter_modifications"]
+                self.assertIsNone(pm["intensity_multiplier"])
+                self.assertIsNone(pm["frequency_shift"])
+                for k in ("created_date", "modified_date"):
+                    doc["metadata"].pop(k, None)
+                doc["waveform_data"]["amplitude"].pop("y_file")
+                docs[name] = doc
+        if len(docs) == 2:
+            self.assertEqual(docs["stdlib"], docs["orjson"])
+
+    def test_both_backends_round_trip(self):
+        for name, patch in self._backends():
+            with self.subTest(backend=name), patch:
+                evt = HapticEvent.new_basic_oscillator("Square", duration=0.1, sample_rate=500.0)
+                evt.metadata.add_tag("a")
+                p = self.path(f"rt_{name}.json")
+                self.assertTrue(evt.save_to_file(p))
+                back = HapticEvent.load_from_file(p)
+                self.assertIsNotNone(back)
+                self.assertEqual(back.metadata.tags, evt.metadata.tags)
+                np.testing.assert_array_equal(back.waveform_data.amp_samples(),
+                                              evt.waveform_data.amp_samples())
+
+    def test_legacy_nan_literals_still_load(self):
+        p = self.path("legacy.json")
+        self.assertTrue(HapticEvent.new_basic_oscillator("Sine", duration=0.05).save_to_file(p))
+        with open(p, encoding="utf-8") as f:
+            doc = json.load(f)
+        doc["parameter_modifications"]["intensity_multiplier"] = float("nan")
+        with open(p, "w", encoding="utf-8") as f:
+            json.dump(doc, f)   # bare NaN, as older stdlib saves wrote it
+        for name, patch in self._backends():
+            with self.subTest(backend=name), patch:
+                back = HapticEvent.load_from_file(p)
+                self.assertIsNotNone(back)
+                self.assertTrue(np.isnan(back.parameter_modifications.intensity_multiplier))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# test_serial_api.py
+"""python_serial_api framing and writer-thread behaviour, against a fake port."""
+
+import asyncio
+import contextlib
+import io
+import threading
+import unittest
+
+from communication.python_serial_api import python_serial_api
+
+
+class _FakePort:
+    is_open = True
+
+    def __init__(self, fail=False):
+        self.data = bytearray()
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def write(self, b):
+        if self.fail:
+            raise OSError("device gone")
+        with self._lock:
+            self.data += bytes(b)
+        return len(b)
+
+    def readline(self):
+        return b"ok\n"
+
+    def close(self):
+        pass
+
+
+def _api(port, writer=True):
+    api = python_serial_api()
+    api.serial_connection = port
+    api.connected = True
+    if writer:
+        api._start_writer()
+    return api
+
+
+def _frames(data):
+    return [bytes(data[i:i + 3]) for i in range(0, len(data), 3)]
+
+
+class _QuietTestCase(unittest.TestCase):
+    def setUp(self):
+        # the API logs every send
+        quiet = contextlib.redirect_stdout(io.StringIO())
+        quiet.__enter__()
+        self.addCleanup(quiet.__exit__, None, None, None)
+
+
+class SendBatchTests(_QuietTestCase):
+    def test_concurrent_batches_keep_frames_intact(self):
+        port = _FakePort()
+        api = _api(port)
+        expected = {}
+
+        def worker(addr, duty):
+            cmds = [(addr, duty, 3, 1)] * 4
+            expected[addr] = bytes(api.create_command(addr, duty, 3, 1))
+            for _ in range(200):
+                self.assertTrue(api.send_batch(cmds))
+
+        threads = [threading.Thread(target=worker, args=(a, a % 16)) for a in (1, 2, 3, 4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        api._stop_writer()
+
+        frames = _frames(port.data)
+        self.assertEqual(len(frames), 4 * 200 * 4)
+        self.assertEqual(set(frames), set(expected.values()))
+
+
+class WriterErrorTests(_QuietTestCase):
+    def test_flush_waits_for_queued_bytes(self):
+        port = _FakePort()
+        api = _api(port)
+        self.assertTrue(api.send_command(5, 7, 2, 1))
+        self.assertTrue(api.flush())
+        self.assertEqual(bytes(port.data), bytes(api.create_command(5, 7, 2, 1)))
+        api._stop_writer()
+
+    def test_failed_write_surfaces_on_next_send(self):
+        api = _api(_FakePort(fail=True))
+        self.assertTrue(api.send_raw(b"\x00\x40\x80"))   # only queued so far
+        self.assertFalse(api.flush())
+        self.assertIsInstance(api.last_error, OSError)
+        self.assertFalse(api.send_command(1, 7, 2, 1))
+        self.assertFalse(api.send_batch([(1, 7, 2, 0)]))
+        self.assertFalse(api.send_raw(b"\x00\x40\x80"))
+        api._stop_writer()
+
+    def test_async_send_reports_write_failure(self):
+        api = _api(_FakePort(fail=True))
+        self.assertFalse(asyncio.run(api.send_command_async(1, 7, 2, 1)))
+        api._stop_writer()
+
+    def test_restarting_writer_stops_old_thread_and_clears_error(self):
+        api = _api(_FakePort(fail=True))
+        api.send_raw(b"\x00\x40\x80")
+        api.flush()
+        old = api._tx_thread
+        api.serial_connection = _FakePort()
+        api._start_writer()
+        self.assertFalse(old.is_alive())
+        self.assertIsNone(api.last_error)
+        self.assertTrue(api.send_raw(b"\x00\x40\x80"))
+        self.assertTrue(api.flush())
+        api._stop_writer()
+
+
+if __name__ == "__main__":
+    unittest.main()
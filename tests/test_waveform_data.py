@@ -0,0 +1,92 @@
+# test_waveform_data.py
+"""WaveformData amplitude storage: read-only views, copy and pickle."""
+
+import copy
+import dataclasses
+import pickle
+import unittest
+
+import numpy as np
+
+from event_designer.core import HapticEvent, WaveformData
+
+
+def _wave(n=8, sr=1000.0):
+    y = np.linspace(0.0, 1.0, n)
+    return WaveformData((None, y), [{"time": 0.0, "frequency": 100.0}], n / sr, sr)
+
+
+class AmplitudeViewTests(unittest.TestCase):
+    def test_points_from_arrays_are_read_only(self):
+        wd = _wave()
+        pts = wd.amplitude
+        self.assertEqual(len(pts), 8)
+        self.assertAlmostEqual(pts[1]["time"], 0.001)
+        with self.assertRaises(AttributeError):
+            pts.append({"time": 1.0, "amplitude": 0.0})
+        with self.assertRaises(TypeError):
+            pts[0]["amplitude"] = 5.0
+        self.assertEqual(float(wd.amp_samples()[0]), 0.0)
+
+    def test_assigned_list_stays_editable_with_touch(self):
+        wd = WaveformData([{"time": 0.0, "amplitude": 1.0}], [], 1.0, 10.0)
+        wd.amplitude.append({"time": 0.5, "amplitude": 0.25})
+        wd.touch()
+        np.testing.assert_allclose(wd.amp_samples(), [1.0, 0.25])
+
+    def test_view_assigned_back_is_not_taken_for_arrays(self):
+        wd = _wave(n=2)
+        wd.amplitude = wd.amplitude
+        self.assertIsInstance(wd.amplitude, list)
+        wd.amplitude[0]["amplitude"] = 0.5
+        wd.touch()
+        self.assertEqual(float(wd.amp_samples()[0]), 0.5)
+
+    def test_sample_rate_change_rebuilds_implicit_times(self):
+        wd = _wave()
+        self.assertAlmostEqual(wd.amplitude[1]["time"], 0.001)
+        wd.sample_rate = 500.0
+        self.assertAlmostEqual(wd.amplitude[1]["time"], 0.002)
+
+    def test_get_amplitude_array_is_read_only(self):
+        wd = _wave()
+        a = wd.get_amplitude_array()
+        with self.assertRaises(ValueError):
+            a[0] = 1.0
+        version = wd._version
+        wd.edit_amp_samples()[0] = 0.75
+        wd.amplitude_edited()
+        self.assertGreater(wd._version, version)
+        self.assertEqual(float(wd.get_amplitude_array()[0]), 0.75)
+
+
+class CopyPickleTests(unittest.TestCase):
+    def _event(self):
+        evt = HapticEvent(name="copy")
+        evt.waveform_data = _wave()
+        evt.waveform_data.amplitude   # builds and caches the read-only view
+        return evt
+
+    def test_deepcopy_after_reading_amplitude(self):
+        evt = self._event()
+        dup = copy.deepcopy(evt)
+        np.testing.assert_array_equal(dup.waveform_data.amp_samples(), evt.waveform_data.amp_samples())
+        self.assertEqual(list(dup.waveform_data.amplitude), list(evt.waveform_data.amplitude))
+
+    def test_pickle_after_reading_amplitude(self):
+        evt = self._event()
+        back = pickle.loads(pickle.dumps(evt))
+        np.testing.assert_array_equal(back.waveform_data.amp_samples(), evt.waveform_data.amp_samples())
+        with self.assertRaises(TypeError):
+            back.waveform_data.amplitude[0]["amplitude"] = 1.0
+
+    def test_asdict_after_reading_amplitude(self):
+        wd = _wave()
+        wd.amplitude
+        d = dataclasses.asdict(wd)
+        self.assertEqual(len(d["amplitude"]), 8)
+        self.assertAlmostEqual(d["amplitude"][1]["time"], 0.001)
+
+
+if __name__ == "__main__":
+    unittest.main()